@@ -48,6 +48,7 @@ from ._listing import (
     VisitError,
     VisitResult,
     walk,
+    walk_glob,
 )
 from ._metadata import (
     GroupMetadata,
@@ -110,6 +111,7 @@ __all__ = [
     "LayoutMismatchHandling",
     "StandardVisitor",
     "walk",
+    "walk_glob",
     "VisitResult",
     "FileSystemMetadataCollector",
 ]
@@ -1,5 +1,6 @@
 import abc
 import datetime as dt
+import functools
 import re
 import typing as tp
 from enum import Enum, auto
@@ -18,6 +19,14 @@ from fcollections.time import (
 T = tp.TypeVar("T")
 
 
+@functools.lru_cache(maxsize=65536)
+def _parse_datetime(input_string: str, date_fmt: str) -> np.datetime64:
+    # Files of a collection often share the same dates (production date,
+    # period bounds, ...). Caching the conversion avoids running strptime and
+    # the numpy conversion for each of these files
+    return np.datetime64(dt.datetime.strptime(input_string, date_fmt))
+
+
 class ICodec(abc.ABC, tp.Generic[T]):
     """Coder-Decoder interface.
 
@@ -143,6 +152,9 @@ class EnumCodec(ICodec[type[Enum]]):
         underscore_encoded: bool = True,
     ):
         self.enum_cls = enum_cls
+        # Decoding is done for each file name: a plain dict lookup avoids the
+        # EnumMeta.__getitem__ indirection. __members__ also holds aliases
+        self._by_name = dict(enum_cls.__members__)
         if isinstance(case_type_decoded, str):
             case_type_decoded = CaseType[case_type_decoded]
         self.case_type_decoded = case_type_decoded
@@ -164,7 +176,7 @@ class EnumCodec(ICodec[type[Enum]]):
             input_string = input_string.lower()
 
         try:
-            output_enum = self.enum_cls[input_string]
+            output_enum = self._by_name[input_string]
         except KeyError as exc:
             msg = (
                 f"'{input_string}' could not be converted to a "
@@ -199,7 +211,7 @@ class DateTimeCodec(ICodec[np.datetime64]):
         output_date = None
         for d_fmt in self.date_fmt:
             try:
-                output_date = np.datetime64(dt.datetime.strptime(input_string, d_fmt))
+                output_date = _parse_datetime(input_string, d_fmt)
                 break
             except ValueError:
                 continue
@@ -313,8 +325,8 @@ class PeriodCodec(ICodec[Period]):
             raise DecodingError(msg)
 
         try:
-            start_date = np.datetime64(dt.datetime.strptime(split[0], self.date_fmt))
-            end_date = np.datetime64(dt.datetime.strptime(split[1], self.date_fmt))
+            start_date = _parse_datetime(split[0], self.date_fmt)
+            end_date = _parse_datetime(split[1], self.date_fmt)
         except ValueError as exc:
             # In case the date conversion failed. This should not happen if
             # the input regex is properly configured (with groups defined with
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import dataclasses as dc
+import glob
 import re
 import string
 import typing as tp
@@ -36,6 +37,57 @@ from ._testers import (
 T = tp.TypeVar("T")
 U = tp.TypeVar("U")
 
+# Characters that are not literal when they start a regex
+_REGEX_SPECIAL_CHARACTERS = frozenset(".^$*+?{}[]|()\\")
+
+
+def _leading_characters(regex: re.Pattern) -> frozenset[str] | None:
+    """Compute the characters a string must start with to match a regex.
+
+    The computation is only done for patterns anchored at the beginning of the
+    string (``^`` or ``\\A``) and followed by a literal character, possibly
+    escaped. Patterns with alternations are skipped, because a branch could
+    start with any other character.
+
+    Parameters
+    ----------
+    regex
+        Compiled pattern
+
+    Returns
+    -------
+    :
+        The set of possible leading characters, or None if this set cannot be
+        determined (unanchored pattern, alternations, case insensitive
+        matching, leading group or character class, ...)
+    """
+    pattern = regex.pattern
+    if (
+        regex.flags & (re.IGNORECASE | re.MULTILINE | re.VERBOSE)
+        or isinstance(pattern, bytes)
+        or "|" in pattern
+    ):
+        return None
+
+    if pattern.startswith("^"):
+        pattern = pattern[1:]
+    elif pattern.startswith("\\A"):
+        pattern = pattern[2:]
+    else:
+        return None
+
+    if pattern[:1] == "\\" and pattern[1:2] in _REGEX_SPECIAL_CHARACTERS:
+        character, pattern = pattern[1], pattern[2:]
+    elif pattern[:1] and pattern[0] not in _REGEX_SPECIAL_CHARACTERS:
+        character, pattern = pattern[0], pattern[1:]
+    else:
+        return None
+
+    if pattern[:1] in ("?", "*", "{"):
+        # The literal is optional
+        return None
+    return frozenset(character)
+
 
 class FileNameField(ICodec[T], ITester[U, T]):
 
@@ -361,9 +413,18 @@ class FileNameConvention:
 
     def __post_init__(self):
         self._formatter = FieldFormatter({f.name: f for f in self.fields})
+        self._leading_characters = _leading_characters(self.regex)
         self._check_consistency()
 
     def match(self, filename: str) -> tp.Any:
+        # Anchored patterns can discard a name from its first character without
+        # running the regex. This is useful when multiple layouts are tested on
+        # each node
+        if (
+            self._leading_characters is not None
+            and filename[:1] not in self._leading_characters
+        ):
+            return None
         # Match the file name
         match_object = self.regex.search(filename)
         return match_object
@@ -393,6 +454,62 @@ class FileNameConvention:
         except KeyError as exc:
             raise ValueError("Missing arguments to generate the file name") from exc
 
+    def glob_pattern(self, **kwargs) -> str:
+        """Generate a glob pattern from the generation string.
+
+        The given fields are formatted like in :meth:`generate`, the missing
+        fields are replaced by a wildcard.
+
+        Parameters
+        ----------
+        **kwargs
+            Values of the fields that should appear literally in the pattern
+
+        Returns
+        -------
+        :
+            A glob pattern matching the names generated by this convention
+
+        Raises
+        ------
+        NotImplementedError
+            In case the convention has no generation string
+        """
+        if self.generation_string is None:
+            msg = (
+                "The current file name convention is only configured for "
+                "parsing. Please specify a 'generation_string' to enable "
+                "glob pattern generation"
+            )
+            raise NotImplementedError(msg)
+
+        elements = []
+        for literal_text, field_name, format_spec, conversion in self._formatter.parse(
+            self.generation_string
+        ):
+            elements.append(glob.escape(literal_text))
+            if field_name is None:
+                continue
+            if field_name not in kwargs:
+                elements.append("*")
+                continue
+            replacement_field = "{" + field_name
+            if conversion:
+                replacement_field += "!" + conversion
+            if format_spec:
+                replacement_field += ":" + format_spec
+            replacement_field += "}"
+            elements.append(
+                glob.escape(
+                    self._formatter.format(
+                        replacement_field, **{field_name: kwargs[field_name]}
+                    )
+                )
+            )
+
+        # Consecutive wildcards would be interpreted as a recursive wildcard
+        return re.sub(r"\*{2,}", "*", "".join(elements))
+
     def get_field(self, name: str) -> FileNameField:
         """Retrieve a field from its name.
 
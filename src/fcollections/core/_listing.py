@@ -3,8 +3,12 @@ from __future__ import annotations
 import abc
 import dataclasses as dc
 import functools
+import glob
+import itertools
 import logging
+import operator
 import os
+import sys
 import typing as tp
 import warnings
 from enum import Enum, auto
@@ -18,6 +22,8 @@ from ._filenames import FileNameConvention, FileNameField
 
 logger = logging.getLogger(__name__)
 
+_INTERN_MAX_LENGTH = 64
+
 
 class FileListingError(Exception):
     """Raised when an error occurs during files discovery and
@@ -118,12 +124,16 @@ class Layout(ILayout):
 
     def __init__(self, conventions: list[FileNameConvention]):
         self.conventions = conventions
+        # Field names of each level, shared by the path generation and the
+        # filters configuration
+        self._names = [
+            frozenset(f.name for f in convention.fields) for convention in conventions
+        ]
         self.set_filters()
 
     def generate(self, root: str, **fields: tp.Any) -> str:
         elements = []
-        for convention in self.conventions:
-            names = [f.name for f in convention.fields]
+        for convention, names in zip(self.conventions, self._names):
             element = convention.generate(
                 **{k: v for k, v in fields.items() if k in names}
             )
@@ -134,9 +144,7 @@ class Layout(ILayout):
     def set_filters(self, **references: tp.Any):
         filters = []
         unknown_references = set(references)
-        for level, convention in enumerate(self.conventions):
-            names = [f.name for f in convention.fields]
-
+        for level, (convention, names) in enumerate(zip(self.conventions, self._names)):
             filtered_references = {k: v for k, v in references.items() if k in names}
             unknown_references -= set(filtered_references)
             logger.debug(
@@ -201,6 +209,38 @@ class Layout(ILayout):
         """
         return self.filters[level].test(record)
 
+    def to_glob(self, root: str) -> str | None:
+        """Build a glob pattern matching the files described by the layout.
+
+        Fields filtered with a single string or enum value are written
+        literally in the pattern. Other fields are replaced by wildcards: the
+        files matching the pattern must still be parsed and tested.
+
+        Parameters
+        ----------
+        root
+            The root path
+
+        Returns
+        -------
+        :
+            A glob pattern, or None if one of the conventions cannot generate
+            names
+        """
+        elements = []
+        for convention, record_filter in zip(self.conventions, self.filters):
+            if convention.generation_string is None:
+                return None
+            literals = {
+                k: v
+                for k, v in record_filter.references.items()
+                if isinstance(v, (str, Enum))
+            }
+            elements.append(convention.glob_pattern(**literals))
+
+        # The root is taken literally, like the literal parts of the names
+        return "/".join([glob.escape(root.rstrip("/")), *elements])
+
     @property
     def names(self) -> set[str]:
         return set(
@@ -230,6 +270,10 @@ class INode(abc.ABC):
         Nesting level of the current node with respect to the tree root
     """
 
+    # Nodes are created for each entry of the walked tree: slots avoid the
+    # per-instance __dict__
+    __slots__ = ("name", "info", "level")
+
     def __init__(self, name: str, info: dict[str, tp.Any], level: int):
         self.name = name
         self.info = info
@@ -268,6 +312,8 @@ class INode(abc.ABC):
 class FileNode(INode):
     """File node of a file system tree."""
 
+    __slots__ = ()
+
     def accept(self, visitor: LayoutVisitor) -> VisitResult:
         return visitor.visit_file(self)
 
@@ -303,6 +349,8 @@ class DirNode(INode):
         directory nodes, and will not be explored
     """
 
+    __slots__ = ("fs", "follow_symlinks", "_children")
+
     def __init__(
         self,
         name,
@@ -311,6 +359,10 @@ class DirNode(INode):
         level: int,
         follow_symlinks: bool = False,
     ):
+        if isinstance(name, str) and len(name) < _INTERN_MAX_LENGTH:
+            # Directory names such as 'cycle_001' repeat across branches:
+            # interning them shares one string for all nodes
+            name = sys.intern(name)
         super().__init__(name, info, level)
         self.fs = fs
         self.follow_symlinks = follow_symlinks
@@ -378,11 +430,18 @@ class VisitResult:
     """True if we should continue to explore the current branch."""
     payload: tp.Any | None = None
     """Post processing result of a node by the visitor."""
-    surviving_layouts: list[Layout] = dc.field(default_factory=list)
+    surviving_layouts: tp.Sequence[Layout] = dc.field(default_factory=list)
     """:class:`LayoutVisitor` only, used to know which semantic is still valid
     for the current branch."""
 
 
+# Results without payload are the most common ones (filtered files, pruned
+# branches, ...). They are shared instead of being allocated for each node, the
+# empty tuple of surviving layouts keeps them immutable
+_STOP_EXPLORATION = VisitResult(False, None, ())
+_CONTINUE_EXPLORATION = VisitResult(True, None, ())
+
+
 class IVisitor(abc.ABC):
     """Visitor processing an :class:`INode`.
 
@@ -461,18 +520,18 @@ class StandardVisitor(IVisitor):
     """
 
     def visit_dir(self, dir_node: DirNode) -> VisitResult:
-        dirs = []
-        files = []
-        for x in dir_node.children():
-            if isinstance(x, DirNode):
-                dirs.append(x.name)
-            else:
-                files.append(x.name)
+        # Partition the children with C-level iterators instead of branching
+        # on each child
+        children = dir_node.children()
+        names = list(map(operator.attrgetter("name"), children))
+        is_dir = [isinstance(child, DirNode) for child in children]
+        dirs = list(itertools.compress(names, is_dir))
+        files = list(itertools.compress(names, map(operator.not_, is_dir)))
         return VisitResult(True, (dir_node.info["name"], dirs, files))
 
     def visit_file(self, file_node: DirNode) -> VisitResult:
         # No payload in visit_file
-        return VisitResult(False)
+        return _STOP_EXPLORATION
 
     def advance(self, result: VisitResult) -> StandardVisitor:
         # Visitor should advance without copy, duplication or state alteration
@@ -601,7 +660,7 @@ class LayoutVisitor(IVisitor):
                 "Folder %s filtered out, branch exploration stopped",
                 dir_node.info["name"],
             )
-            return VisitResult(False)
+            return _STOP_EXPLORATION
 
         # Don't return a payload for dir nodes (will be subject to change later)
         return VisitResult(True, None, layouts_for_children)
@@ -644,10 +703,16 @@ class LayoutVisitor(IVisitor):
                 # Leaf node should be identical for all layouts. Do not bother
                 # testing all layouts if the record has already been filtered
                 # out
-                return VisitResult(False)
+                return _STOP_EXPLORATION
         return self._on_mismatch(file_node, self.on_mismatch_file)
 
     def advance(self, result: VisitResult) -> LayoutVisitor:
+        # The visitor state is never modified: it can be shared by the
+        # branches where no layout has been pruned
+        if result.surviving_layouts is self.layouts or (
+            result.surviving_layouts == self.layouts
+        ):
+            return self
         return LayoutVisitor(
             result.surviving_layouts,
             self.stat_fields,
@@ -665,12 +730,12 @@ class LayoutVisitor(IVisitor):
                 "Node %s does not match any layout, branch exploration stopped.",
                 node.info["name"],
             )
-            return VisitResult(False)
+            return _STOP_EXPLORATION
 
         msg = f"Node {node.info['name']} does not match any layout."
         if on_mismatch == LayoutMismatchHandling.WARN:
             warnings.warn(msg)
-            return VisitResult(False)
+            return _STOP_EXPLORATION
         else:
             raise LayoutMismatchError(msg)
 
@@ -720,7 +785,7 @@ class NoLayoutVisitor(IVisitor):
         :
             Node information and visit metadata.
         """
-        return VisitResult(True)
+        return _CONTINUE_EXPLORATION
 
     def visit_file(self, file_node: DirNode) -> VisitResult:
         logger.debug("Visiting file %s", file_node.info["name"])
@@ -728,14 +793,14 @@ class NoLayoutVisitor(IVisitor):
         try:
             record = self.convention.parse(self.convention.match(file_node.name))
         except (DecodingError, AttributeError):
-            return VisitResult(False)
+            return _STOP_EXPLORATION
 
         if self.record_filter.test(record):
             # Files are leaf, no need to continue exploration
             return VisitResult(
                 False, (*record, *[file_node.info[x] for x in self.stat_fields])
             )
-        return VisitResult(False)
+        return _STOP_EXPLORATION
 
     def advance(self, result: VisitResult) -> IVisitor:
         return self
@@ -787,6 +852,95 @@ def walk(node: INode, visitor: IVisitor) -> tp.Iterator[tp.Any]:
         yield from walk(child, visitor.advance(result))
 
 
+def walk_glob(node: DirNode, visitor: LayoutVisitor) -> tp.Iterator[tp.Any]:
+    """Walk of a file system tree driven by the layouts glob patterns.
+
+    Instead of listing each directory, the files are listed with one
+    :meth:`fsspec.spec.AbstractFileSystem.glob` call per layout, which is a
+    single request for some backends. The files found are then visited as in
+    :func:`walk`, directories included, so that the layouts parsing and
+    filtering are unchanged.
+
+    The glob patterns are built from the conventions generation strings. This
+    walk is only equivalent to :func:`walk` if the generation strings describe
+    all the names accepted by the conventions regexes. Mismatching nodes that
+    are not matched by a pattern are silently skipped.
+
+    Parameters
+    ----------
+    node
+        Folder node representing the root of the tree
+    visitor
+        Visitor that will process the nodes and produce some results
+
+    Yields
+    ------
+    :
+        The results of all file visits in the tree
+
+    See Also
+    --------
+    walk
+        Recursive walk of the tree
+    Layout.to_glob
+        Glob pattern of a layout
+    """
+    fs = node.fs
+    root = fs._strip_protocol(node.info["name"]).rstrip("/")
+    patterns = [layout.to_glob(root) for layout in visitor.layouts]
+    if any(pattern is None for pattern in patterns):
+        logger.debug("Layouts cannot generate glob patterns, fallback to walk")
+        yield from walk(node, visitor)
+        return
+
+    result = node.accept(visitor)
+    if not result.explore_next:
+        return
+
+    infos = {}
+    for pattern in patterns:
+        logger.debug("Listing files matching %s", pattern)
+        infos.update(fs.glob(pattern, detail=True))
+
+    # Visitors for each directory, None if the branch has been pruned
+    visitors: dict[tuple[str, ...], LayoutVisitor | None] = {
+        (): visitor.advance(result)
+    }
+
+    def branch_visitor(parts: tuple[str, ...]) -> LayoutVisitor | None:
+        if parts not in visitors:
+            parent_visitor = branch_visitor(parts[:-1])
+            if parent_visitor is None:
+                visitors[parts] = None
+            else:
+                dir_node = DirNode(
+                    parts[-1],
+                    {"name": "/".join((root, *parts))},
+                    fs,
+                    len(parts),
+                    node.follow_symlinks,
+                )
+                dir_result = dir_node.accept(parent_visitor)
+                visitors[parts] = (
+                    parent_visitor.advance(dir_result)
+                    if dir_result.explore_next
+                    else None
+                )
+        return visitors[parts]
+
+    for path in sorted(infos):
+        info = infos[path]
+        if info["type"] == "directory":
+            continue
+        parts = tuple(path[len(root) + 1 :].split("/"))
+        file_visitor = branch_visitor(parts[:-1])
+        if file_visitor is None:
+            continue
+        file_result = FileNode(parts[-1], info, len(parts)).accept(file_visitor)
+        if file_result.payload is not None:
+            yield file_result.payload
+
+
 class RecordFilter:
     """Utility class for filtering values.
 
@@ -874,6 +1028,7 @@ class FileSystemMetadataCollector:
         predicates: tuple[tp.Callable[[tuple[tp.Any, ...]], bool], ...] = (),
         stat_fields: tuple[str] = (),
         enable_layouts: bool = True,
+        use_glob: bool = False,
         **filters,
     ) -> pda.DataFrame:
         """
@@ -891,6 +1046,10 @@ class FileSystemMetadataCollector:
             will speed up the listing, but may raise an error if some directory
             do not match the declared layouts. Set to False to scan the entire
             directory and parse the files only
+        use_glob
+            Set to True to list the files with one glob pattern per layout
+            instead of walking the tree (see :func:`walk_glob`). Only relevant
+            if ``enable_layouts`` is True
         **filters
             filters for files/folde selection over the fields declared in the
             layouts. Each field can accept a different filter value depending on
@@ -918,7 +1077,7 @@ class FileSystemMetadataCollector:
         if enable_layouts:
             logger.debug("Using layouts to speed up listing")
             visitor = LayoutVisitor(self.layouts, stat_fields)
-            records = walk(self.root_node, visitor)
+            records = (walk_glob if use_glob else walk)(self.root_node, visitor)
         else:
             logger.debug("Full scan (not using layouts)")
             layout = self.layouts[-1]
@@ -936,6 +1095,7 @@ class FileSystemMetadataCollector:
         predicates: tuple[tp.Callable[[tuple[tp.Any, ...]], bool], ...] = (),
         stat_fields: tuple[str] = (),
         enable_layouts: bool = True,
+        use_glob: bool = False,
         **filters,
     ) -> pda.DataFrame:
         """
@@ -953,6 +1113,10 @@ class FileSystemMetadataCollector:
             will speed up the listing, but may raise an error if some directory
             do not match the declared layouts. Set to False to scan the entire
             directory and parse the files only
+        use_glob
+            Set to True to list the files with one glob pattern per layout
+            instead of walking the tree (see :func:`walk_glob`). Only relevant
+            if ``enable_layouts`` is True
         **filters
             filters for files/folders selection over the fields declared in the
             file name convention and layout (optional). Each field can accept a
@@ -976,7 +1140,7 @@ class FileSystemMetadataCollector:
         """
         file_convention = self.layouts[0].conventions[-1]
         return pda.DataFrame(
-            self.discover(predicates, stat_fields, enable_layouts, **filters),
+            self.discover(predicates, stat_fields, enable_layouts, use_glob, **filters),
             columns=[f.name for f in file_convention.fields]
             + ["filename"]
             + list(stat_fields),
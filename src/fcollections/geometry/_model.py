@@ -122,12 +122,18 @@ def guess_longitude_convention(lon: np.array) -> StandardLongitudeConvention:
         310] uses both [-180, 180] and [0, 360] conventions and will trigger an
         exception
     """
-    lon = lon[~np.isnan(lon)]
+    # Only the extrema are needed. fmin and fmax ignore the NaNs without
+    # building a filtered copy and the comparison masks
+    if lon.size == 0:
+        return StandardLongitudeConvention.CONV_360
+    lon_min = np.fmin.reduce(lon, axis=None)
+    lon_max = np.fmax.reduce(lon, axis=None)
 
-    if np.all((lon >= 0) & (lon <= 360)):
+    # Only NaNs, every convention is valid
+    if np.isnan(lon_min) or (lon_min >= 0 and lon_max <= 360):
         return StandardLongitudeConvention.CONV_360
 
-    if np.all((lon >= -180) & (lon <= 180)):
+    if lon_min >= -180 and lon_max <= 180:
         return StandardLongitudeConvention.CONV_180
 
     conventions = ", ".join([str(c.value) for c in StandardLongitudeConvention])
@@ -1,3 +1,4 @@
+import functools
 import logging
 
 import geopandas as gpd
@@ -13,10 +14,39 @@ logger = logging.getLogger(__name__)
 
 
 def _read_geometries_file(phase: Phase) -> gpd.GeoDataFrame:
-    karin_2kms_geometries_file = KarinFootprints()[phase.short_name]
+    # Phase is not hashable, the cache is keyed by its short name
+    return _read_footprints(phase.short_name)
+
+
+@functools.lru_cache(maxsize=8)
+def _read_footprints(short_name: str) -> gpd.GeoDataFrame:
+    # The frame is shared between the calls and must not be modified. The
+    # queries only return selections (copies) of it
+    karin_2kms_geometries_file = KarinFootprints()[short_name]
     return gpd.read_file(karin_2kms_geometries_file)
 
 
+@functools.lru_cache(maxsize=8)
+def _footprints_conventions(short_name: str) -> tuple[np.ndarray, np.ndarray]:
+    """Masks of the half orbits stored in [0, 360] and in [-180, 180].
+
+    The half orbits fitting in both intervals are flagged in the first
+    mask only.
+    """
+    swath_geometries = _read_footprints(short_name)
+    bounds = shp.bounds(swath_geometries.geometry.values)
+    in_360 = (bounds[:, 0] >= 0) & (bounds[:, 2] <= 360)
+    in_180 = (bounds[:, 0] >= -180) & (bounds[:, 2] <= 180)
+    if not np.all(in_360 | in_180):
+        # Let the convention guesser raise its error
+        guess_longitude_convention(bounds[~(in_360 | in_180)][:, [0, 2]].ravel())
+
+    in_180 &= ~in_360
+    in_360.flags.writeable = False
+    in_180.flags.writeable = False
+    return in_360, in_180
+
+
 def query_geometries(
     half_orbit_numbers: int | list[int],
     phase: Phase | str = MissionsPhases.science.value,
@@ -100,24 +130,19 @@ def query_half_orbits_intersect(
         for conv in StandardLongitudeConvention
     }
 
-    select = swath_geometries.apply(_filter_intersect, bbox_conv=bbox_conv_dict, axis=1)
+    # Half orbits are stored either in [-180, 180] or [0, 360], their
+    # convention is guessed from their longitude bounds
+    in_360, in_180 = _footprints_conventions(phase.short_name)
+
+    # The spatial index prunes the half orbits whose bounding boxes do not
+    # cross the bbox before testing the exact intersection
+    select = np.zeros(len(swath_geometries), dtype=bool)
+    for conv, half_orbits_in_conv in (
+        (StandardLongitudeConvention.CONV_360, in_360),
+        (StandardLongitudeConvention.CONV_180, in_180),
+    ):
+        boxes = [shp.box(*bbox_split) for bbox_split in bbox_conv_dict[conv]]
+        _, indices = swath_geometries.sindex.query(boxes, predicate="intersects")
+        select[indices[half_orbits_in_conv[indices]]] = True
 
     return swath_geometries[select]
-
-
-def _filter_intersect(row, bbox_conv):
-    # Get half orbit's convention
-    pass_coords = list(row.geometry.exterior.coords)
-    convention = guess_longitude_convention(
-        np.array([lon for (lon, lat) in pass_coords])
-    )
-
-    # Get the bbox converted to this convention
-    bbox_splits = bbox_conv[convention]
-
-    half_orbit_polygon = shp.Polygon(pass_coords)
-    # Compute intersection between pass geometry and the bbox
-    # bbox longitude range may have been splitted
-    return np.any(
-        [half_orbit_polygon.intersects(shp.geometry.box(*bbox)) for bbox in bbox_splits]
-    )
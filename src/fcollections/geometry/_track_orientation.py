@@ -52,40 +52,42 @@ def track_orientation(
     latitudes = np.radians(latitude)
     earth_radius = spheroid.mean_radius()
 
+    after = slice(half_width, None)
+    before = slice(0, -half_width)
+
     delta_lon = slice_along_axis(
-        longitudes, along_track_axis, slice(half_width, None)
-    ) - slice_along_axis(longitudes, along_track_axis, slice(0, -half_width))
+        longitudes, along_track_axis, after
+    ) - slice_along_axis(longitudes, along_track_axis, before)
 
     # Normalizing the delta_lon between [-pi, pi] will ensure we take the shortest
     # of the two paths available for the distance computation
     # For retrograde orbit (lon goes from 0.5° to 359.5° -> delta_lon = +359° -> -1°)
-    delta_lon[delta_lon > np.pi] = delta_lon[delta_lon > np.pi] - 2 * np.pi
+    delta_lon[delta_lon > np.pi] -= 2 * np.pi
     # For prograde orbit (lon goes from 359.5° to 0.5° -> delta_lon = -359° -> +1°)
-    delta_lon[delta_lon < -np.pi] = delta_lon[delta_lon < -np.pi] + 2 * np.pi
-
-    slice_after = slice_along_axis(latitudes, along_track_axis, slice(half_width, None))
-    slice_before = slice_along_axis(latitudes, along_track_axis, slice(0, -half_width))
-    delta_lat = slice_after - slice_before
-    dy = earth_radius * delta_lat
-
-    dx_before = earth_radius * delta_lon * np.cos(slice_after)
-    dx_after = earth_radius * delta_lon * np.cos(slice_before)
-
-    # return padded dx and dy
-    padding = [(0, 0) for ii in range(latitudes.ndim)]
-    padding_before = padding.copy()
-    padding_before[along_track_axis] = (half_width, 0)
-    padding_after = padding.copy()
-    padding_after[along_track_axis] = (0, half_width)
-
-    dx = np.pad(dx_before, pad_width=padding_before) + np.pad(
-        dx_after, pad_width=padding_after
+    delta_lon[delta_lon < -np.pi] += 2 * np.pi
+    delta_lon *= earth_radius
+
+    slice_after = slice_along_axis(latitudes, along_track_axis, after)
+    slice_before = slice_along_axis(latitudes, along_track_axis, before)
+    dy = earth_radius * (slice_after - slice_before)
+
+    # Accumulate the padded dx and dy directly in full size buffers instead of
+    # padding each term. The buffers keep the precision of the inputs
+    dtype = np.result_type(delta_lon, dy)
+    dx_full = np.zeros(latitudes.shape, dtype=dtype)
+    dy_full = np.zeros(latitudes.shape, dtype=dtype)
+    slice_along_axis(dx_full, along_track_axis, after)[...] += delta_lon * np.cos(
+        slice_after
+    )
+    slice_along_axis(dx_full, along_track_axis, before)[...] += delta_lon * np.cos(
+        slice_before
     )
-    dy = np.pad(dy, pad_width=padding_before) + np.pad(dy, pad_width=padding_after)
+    slice_along_axis(dy_full, along_track_axis, after)[...] += dy
+    slice_along_axis(dy_full, along_track_axis, before)[...] += dy
 
     # This gives the angle relative to the equator. Arctan2 is needed to keep
     # the direction info (direction = sens in french)
-    return np.arctan2(dy, dx)
+    return np.arctan2(dy_full, dx_full)
 
 
 def rotate_vector(
@@ -112,8 +114,9 @@ def rotate_vector(
         Vector component over the j direction
     """
     # Apply the inverse rotation matrix to get the coordinates in the new frame
-    v_i = v_I * np.cos(angles_I_i) + v_J * np.sin(angles_I_i)
-    v_j = -v_I * np.sin(angles_I_i) + v_J * np.cos(angles_I_i)
+    cos, sin = np.cos(angles_I_i), np.sin(angles_I_i)
+    v_i = v_I * cos + v_J * sin
+    v_j = v_J * cos - v_I * sin
     return v_i, v_j
 
 
@@ -166,14 +169,16 @@ def rotate_derivatives(
     --------
     rotate_vector: can rotate a vector to express it in the proper frame
     """
-    cos2, sin2, cossin = (
-        np.cos(angles_I_i) ** 2,
-        np.sin(angles_I_i) ** 2,
-        np.cos(angles_I_i) * np.sin(angles_I_i),
-    )
-    dvx_dx = dvX_dX * cos2 + dvY_dY * sin2 - dvX_dY * cossin - dvY_dX * cossin
-    dvy_dy = dvX_dX * sin2 + dvY_dY * cos2 + dvX_dY * cossin + dvY_dX * cossin
-    dvy_dx = dvX_dX * cossin - dvY_dY * cossin - dvX_dY * sin2 + dvY_dX * cos2
-    dvx_dy = dvX_dX * cossin - dvY_dY * cossin + dvX_dY * cos2 - dvY_dX * sin2
+    cos, sin = np.cos(angles_I_i), np.sin(angles_I_i)
+    cos2, sin2, cossin = cos * cos, sin * sin, cos * sin
+
+    # The cross terms share the same factors, factorize them to save a few
+    # full array operations
+    cross = (dvX_dY + dvY_dX) * cossin
+    diagonal = (dvX_dX - dvY_dY) * cossin
+    dvx_dx = dvX_dX * cos2 + dvY_dY * sin2 - cross
+    dvy_dy = dvX_dX * sin2 + dvY_dY * cos2 + cross
+    dvy_dx = diagonal - dvX_dY * sin2 + dvY_dX * cos2
+    dvx_dy = diagonal + dvX_dY * cos2 - dvY_dX * sin2
 
     return dvx_dx, dvy_dy, dvx_dy, dvy_dx
@@ -1,6 +1,7 @@
 import abc
 import logging
 
+import numba
 import numpy as np
 import xarray as xr
 
@@ -26,9 +27,7 @@ class AreaSelector1D(IAreaSelector, abc.ABC):
         # Finally it selects data with indices slices.
         (lon_min, lat_min, lon_max, lat_max) = bbox
 
-        # Need a copy, _select_2d_indices_intersect_bounds may modify the array
-        # in place
-        lon = ds[self.longitude].values.copy()
+        lon = ds[self.longitude].values
         lat = ds[self.latitude].values
 
         try:
@@ -41,7 +40,7 @@ class AreaSelector1D(IAreaSelector, abc.ABC):
             )
             logger.info(msg)
             data_convention = StandardLongitudeConvention.CONV_360.value
-            data_convention.normalize(lon, inplace=True)
+            lon = data_convention.normalize(lon)
         bbox_lon_norm = data_convention.normalize(np.array((lon_min, lon_max)))
 
         idx = _select_2d_indices_intersect_bounds(
@@ -158,7 +157,7 @@ class AreaSelector2D(IAreaSelector):
         # SEARCH FOR LONGITUDE INDICES
 
         # Search for index of transition in longitude passing from 180 to -180
-        indx_transition = np.where(lon == np.max(lon))[0][0] + 1
+        indx_transition = np.argmax(lon) + 1
 
         lon_slices = []
         # Search for lon_bounds in the first part of the dataset (-180/0, 180)
@@ -179,13 +178,23 @@ class AreaSelector2D(IAreaSelector):
             logger.debug("No intersection between the bbox and the dataset.")
             return ds.isel(**{self.longitude: slice(0), self.latitude: slice(0)})
 
-        ds_sel = xr.concat(
-            [
-                ds.isel(**{self.longitude: slice_i, self.latitude: lat_slice})
-                for slice_i in lon_slices
-            ],
-            dim=self.longitude,
-        )
+        if len(lon_slices) == 1:
+            # Most boxes do not cross the longitude transition, a plain
+            # selection is enough and skips the concatenation machinery
+            ds_sel = ds.isel(
+                **{self.longitude: lon_slices[0], self.latitude: lat_slice}
+            )
+        else:
+            ds_sel = xr.concat(
+                [
+                    ds.isel(**{self.longitude: slice_i, self.latitude: lat_slice})
+                    for slice_i in lon_slices
+                ],
+                dim=self.longitude,
+                # Only concatenate the variables that depend on the
+                # longitude, like the plain selection above
+                data_vars="minimal",
+            )
 
         logger.info("Size of the dataset matching the bbox: %s", dict(ds_sel.sizes))
 
@@ -222,7 +231,7 @@ def _select_slices_intersect_bounds(
 
     x0, x1 = bounds
 
-    if not np.all(data[:-1] <= data[1:]):
+    if not _is_ascending(data):
         # Data is descending. Can happen for latitude coord
         data = data[::-1]
 
@@ -250,6 +259,20 @@ def _select_slices_intersect_bounds(
     return [_create_slice(data, bounds, i, j, ind_start)]
 
 
+@numba.njit(cache=True)
+def _is_ascending(data: np.array) -> bool:  # pragma: no cover
+    """Check that data is sorted in ascending order.
+
+    Equivalent to np.all(data[:-1] <= data[1:]) without the temporary
+    arrays, and stops at the first unordered pair.
+    """
+    for k in range(data.size - 1):
+        # Written as a negation so that NaNs are considered unordered
+        if not data[k] <= data[k + 1]:
+            return False
+    return True
+
+
 def _create_slice(
     data: np.array, bounds: tuple[float, float], i: int, j: int, ind_start: int
 ) -> slice:
@@ -286,10 +309,33 @@ def _select_2d_indices_intersect_bounds(
         )
         raise ValueError(msg)
 
-    # Handle circularity in x axis
-    if x0 > x1:
-        x[x < x0] += x_max
+    # The kernel does not check the bounds of its inputs: make sure x and y
+    # have the same shape (raises a ValueError if they cannot be broadcast)
+    x, y = np.broadcast_arrays(x, y)
+
+    # Handle circularity in x axis. The shifted values are computed in the
+    # kernel so that the input is left untouched
+    circular = x0 > x1
+    if circular:
         x1 += x_max
 
-    idx = np.where((x >= x0) & (x <= x1) & (y >= y0) & (y <= y1))
-    return idx
+    mask = _mask_intersect_bounds(
+        np.ravel(x), np.ravel(y), x0, x1, y0, y1, bool(circular), x.dtype.type(x_max)
+    )
+    return np.unravel_index(np.flatnonzero(mask), x.shape)
+
+
+@numba.njit(parallel=True, cache=True)
+def _mask_intersect_bounds(x, y, x0, x1, y0, y1, circular, x_max):  # pragma: no cover
+    """Flat mask of the points of (x, y) inside the bounds.
+
+    The comparisons are fused in a single pass, without the intermediate
+    boolean arrays.
+    """
+    mask = np.empty(x.size, dtype=np.bool_)
+    for k in numba.prange(x.size):
+        xk = x[k]
+        if circular and xk < x0:
+            xk = xk + x_max
+        mask[k] = (xk >= x0) and (xk <= x1) and (y[k] >= y0) and (y[k] <= y1)
+    return mask
@@ -66,7 +66,8 @@ def numpy_to_julian_day(
     Parameters
     ----------
     timestamp
-        timestamp given as a numpy datetime
+        timestamp given as a numpy datetime. An array of datetimes is also
+        accepted, in which case each element of the tuple is an array
     reference
         Reference for the julian days (defaults to 1950-01-01)
 
@@ -76,12 +77,11 @@ def numpy_to_julian_day(
         Julian day given as a tuple (day, hour, seconds), where seconds can be a
         floating point number
     """
-    delta = timestamp - reference
-    days = delta // np.timedelta64(1, "D")
-    hours = (delta - np.timedelta64(days, "D")) // np.timedelta64(1, "h")
-    seconds = (
-        delta - np.timedelta64(days, "D") - np.timedelta64(hours, "h")
-    ) / np.timedelta64(1, "s")
+    # divmod floors the quotient and keeps the remainder as a timedelta: no
+    # need to rebuild the days and hours deltas
+    days, remainder = divmod(timestamp - reference, np.timedelta64(1, "D"))
+    hours, remainder = divmod(remainder, np.timedelta64(1, "h"))
+    seconds = remainder / np.timedelta64(1, "s")
     return days, hours, seconds
 
 
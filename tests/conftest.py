@@ -46,6 +46,7 @@ from fixtures._l3_lr_ssh import (
     l3_lr_ssh_unsmoothed_files,
 )
 from fixtures._l4_ssha import (
+    l4_ssha_basenames,
     l4_ssha_dataset_0_360,
     l4_ssha_dataset_180_180,
     l4_ssha_dataset_reversed_lat,
@@ -107,13 +108,20 @@ def pytest_sessionstart(session: pytest.Session):
 
 
 def pytest_addoption(parser: pytest.Parser):
-    """Add an option to run the tests without the geo packages."""
+    """Add options to run the tests without the geo packages or the FTP
+    server."""
     parser.addoption(
         "--without-geo-packages",
         action="store_true",
         default=False,
         help="Simulate missing geo packages like 'pyinterp', 'shapely' and 'geopandas'",
     )
+    parser.addoption(
+        "--no-ftp",
+        action="store_true",
+        default=False,
+        help="Skip the tests that need a local FTP server",
+    )
 
 
 def pytest_configure(config: pytest.Config):
@@ -22,6 +22,7 @@ from fcollections.core import (
     FileNameFieldPeriod,
     FileNameFieldString,
 )
+from fcollections.core._filenames import _leading_characters
 from fcollections.time import ISODuration, Period
 
 
@@ -438,6 +439,60 @@ def test_filename_convention_match_error(convention):
     assert not convention.match(filename)
 
 
+@pytest.mark.parametrize(
+    "pattern, matching, not_matching",
+    [
+        (r"^(?P<method>4dvarnet|miost)$", ["miost", "4dvarnet"], ["", "xmiost"]),
+        (r"^[a-c]?v(?P<version>.*)$", ["v1", "bv1"], ["dv1", ""]),
+        (r"^(?P<year>\d{4})$", ["2024"], ["", "24"]),
+        (r"cycle_(?P<cycle>\d{3})", ["cycle_001", "my_cycle_001"], ["cycle"]),
+        (r"(?i)^cycle_(?P<cycle>\d{3})", ["CYCLE_001"], ["my_cycle_001"]),
+        (r"^(?P<prefix>a|)b", ["ab", "b"], ["cb"]),
+        (r"^cycle_(?P<cycle>\d{3})$", ["cycle_001"], ["", "my_cycle_001"]),
+        (r"\A\.(?P<name>\w+)", [".hidden"], ["hidden", ""]),
+        (r"^a?b", ["ab", "b"], ["cb"]),
+    ],
+)
+def test_filename_convention_match_leading_characters(
+    pattern: str, matching: list[str], not_matching: list[str]
+):
+    regex = re.compile(pattern)
+    convention = FileNameConvention(
+        regex, [FileNameFieldString(name) for name in regex.groupindex]
+    )
+    for name in matching:
+        assert convention.match(name) is not None
+    for name in not_matching:
+        assert convention.match(name) is None
+
+
+@pytest.mark.parametrize(
+    "pattern, flags, expected",
+    [
+        (r"^cycle_(?P<cycle>\d{3})$", 0, frozenset("c")),
+        (r"\Av(?P<version>.*)$", 0, frozenset("v")),
+        (r"^\.(?P<name>\w+)", 0, frozenset(".")),
+        (r"^a+b", 0, frozenset("a")),
+        (r"cycle_(?P<cycle>\d{3})", 0, None),
+        (r"^(?P<method>4dvarnet|miost)$", 0, None),
+        (r"^a|b", 0, None),
+        (r"^[a-c]v", 0, None),
+        (r"^\d{4}", 0, None),
+        (r"^a?b", 0, None),
+        (r"^a*b", 0, None),
+        (r"^a{0,1}b", 0, None),
+        (r"^cycle", re.IGNORECASE, None),
+        (r"^cycle", re.MULTILINE, None),
+        (r"^ cycle", re.VERBOSE, None),
+        (r"^", 0, None),
+    ],
+)
+def test_leading_characters(
+    pattern: str, flags: re.RegexFlag, expected: frozenset[str] | None
+):
+    assert _leading_characters(re.compile(pattern, flags)) == expected
+
+
 def test_filename_convention_parse(convention, expected_record, expected_filename):
     record = convention.parse(convention.match(expected_filename))
     assert record == expected_record
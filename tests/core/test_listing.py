@@ -2,6 +2,7 @@ import re
 import socket
 import threading
 import typing as tp
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import nullcontext
 from enum import Enum, auto
 from pathlib import Path
@@ -40,6 +41,7 @@ from fcollections.core._listing import (
     StandardVisitor,
     VisitResult,
     walk,
+    walk_glob,
 )
 from fcollections.time import ISODuration, Period
 
@@ -49,6 +51,13 @@ def test_file_node_no_children():
     assert len(node.children()) == 0
 
 
+def test_nodes_slots():
+    file_node = FileNode("foo", {}, 0)
+    dir_node = DirNode("bar", {"name": "bar"}, None, 0)
+    assert not hasattr(file_node, "__dict__")
+    assert not hasattr(dir_node, "__dict__")
+
+
 @pytest.fixture(scope="session")
 def filepaths() -> list[str]:
     # The files that we will use to test the listing and filtering using the
@@ -93,15 +102,18 @@ def memory_fs() -> MemoryFileSystem:
 @pytest.fixture(scope="session")
 def memory_root(memory_fs: MemoryFileSystem, filepaths: list[str]) -> Path:
     root = Path("/myfc")
-    for filepath in filepaths:
-        filepath = root / filepath
-        memory_fs.makedirs(filepath.parent, exist_ok=True)
-        memory_fs.touch(filepath)
+    # Parent directories are implied by the files paths in memory
+    memory_fs.pipe({(root / filepath).as_posix(): b"" for filepath in filepaths})
     return root
 
 
-@pytest.fixture(scope="session")
-def ftp_server(tmp_path_factory: pytest.TempPathFactory):
+@pytest.fixture(scope="module")
+def ftp_server(
+    tmp_path_factory: pytest.TempPathFactory, request: pytest.FixtureRequest
+):
+    if request.config.getoption("--no-ftp"):
+        pytest.skip("FTP tests disabled with --no-ftp")
+
     # Create a temp directory to act as FTP root
     ftp_root = tmp_path_factory.mktemp("myfc")
 
@@ -138,7 +150,7 @@ def ftp_server(tmp_path_factory: pytest.TempPathFactory):
     server.close_all()
 
 
-@pytest.fixture(scope="session")
+@pytest.fixture(scope="module")
 def ftp_fs(ftp_server: list[str]) -> FTPFileSystem:
     fs = FTPFileSystem(
         host=ftp_server["host"],
@@ -149,15 +161,33 @@ def ftp_fs(ftp_server: list[str]) -> FTPFileSystem:
     return fs
 
 
-@pytest.fixture(scope="session")
+@pytest.fixture(scope="module")
 def ftp_root(
     ftp_fs: FTPFileSystem, ftp_server: list[str], filepaths: list[str]
 ) -> FTPFileSystem:
     root = ftp_server["root"]
-    for filepath in filepaths:
-        filepath = root / filepath
-        ftp_fs.makedirs(filepath.parent.as_posix(), exist_ok=True)
-        ftp_fs.touch(filepath.as_posix())
+    filepaths = [root / filepath for filepath in filepaths]
+    for parent in sorted({filepath.parent for filepath in filepaths}):
+        ftp_fs.makedirs(parent.as_posix(), exist_ok=True)
+
+    # Each touch is a round trip to the server: spread them over a few
+    # connections. FTP sessions are not thread-safe, so each worker needs its
+    # own file system instance
+    local = threading.local()
+
+    def touch(filepath: Path):
+        if not hasattr(local, "fs"):
+            local.fs = FTPFileSystem(
+                host=ftp_server["host"],
+                port=ftp_server["port"],
+                username=ftp_server["username"],
+                password=ftp_server["password"],
+                skip_instance_cache=True,
+            )
+        local.fs.touch(filepath.as_posix())
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(touch, filepaths))
     return root
 
 
@@ -185,9 +215,11 @@ def local_root(
     links: list[tuple[str]],
 ) -> Path:
     my_fc = tmp_path_factory.mktemp("myfc")
+    filepaths = [my_fc / filepath for filepath in filepaths]
+    for parent in sorted({filepath.parent for filepath in filepaths}):
+        parent.mkdir(parents=True, exist_ok=True)
     for filepath in filepaths:
-        (my_fc / filepath).parent.mkdir(parents=True, exist_ok=True)
-        (my_fc / filepath).touch()
+        filepath.touch()
 
     for destination, source in links:
         (my_fc / destination).parent.mkdir(parents=True, exist_ok=True)
@@ -208,6 +240,27 @@ class MockFS:
         ]
 
 
+class MockInterleavedFS:
+
+    def _strip_protocol(self, name: str):
+        return name
+
+    def ls(self, path, detail=True):
+        return [
+            {"name": f"{path}/b", "type": "file"},
+            {"name": f"{path}/d2", "type": "directory"},
+            {"name": f"{path}/a", "type": "file"},
+            {"name": f"{path}/d1", "type": "directory"},
+        ]
+
+
+def test_standard_visitor_partition_order():
+    # Directories and files must keep the listing order, like fsspec.walk
+    root_node = DirNode("root", {"name": "root"}, MockInterleavedFS(), 0)
+    result = StandardVisitor().visit_dir(root_node)
+    assert result.payload == ("root", ["d2", "d1"], ["b", "a"])
+
+
 def test_walk_parent_pruning():
     mock_fs = MockFS()
     root_node = DirNode("root", {"name": "root"}, mock_fs, 0)
@@ -484,7 +537,7 @@ def test_layout_visit_dir_outlier(
         result = visitor.visit_dir(node)
         assert result.payload is None
         assert result.explore_next is False
-        assert result.surviving_layouts == []
+        assert len(result.surviving_layouts) == 0
 
 
 @pytest.mark.parametrize(
@@ -518,7 +571,7 @@ def test_layout_visit_file(
 
     result = visitor.visit_file(node)
     assert not result.explore_next
-    assert result.surviving_layouts == []
+    assert len(result.surviving_layouts) == 0
 
     assert result.payload == (*expected_record, (memory_root / path).as_posix())
 
@@ -551,7 +604,7 @@ def test_layout_visit_file_outlier(
         result = visitor.visit_file(node)
         assert result.payload is None
         assert result.explore_next is False
-        assert result.surviving_layouts == []
+        assert len(result.surviving_layouts) == 0
 
 
 def test_layout_visit_file_stat_fields(
@@ -585,14 +638,15 @@ def test_layout_advance(layouts_v2: list[Layout]):
         on_mismatch_directory=LayoutMismatchHandling.WARN,
         on_mismatch_file=LayoutMismatchHandling.RAISE,
     )
-    result = VisitResult(True, None, layouts_v2)
+    # No pruning, the visitor is reused
+    result = VisitResult(True, None, list(layouts_v2))
+    assert visitor.advance(result) is visitor
+
+    result = VisitResult(True, None, layouts_v2[:1])
     new_visitor = visitor.advance(result)
     assert new_visitor is not visitor
     assert new_visitor.on_mismatch_directory == visitor.on_mismatch_directory
     assert new_visitor.on_mismatch_file == visitor.on_mismatch_file
-
-    result = VisitResult(True, None, layouts_v2[:1])
-    new_visitor = visitor.advance(result)
     assert len(new_visitor.layouts) == 1
     assert len(visitor.layouts) == 2
 
@@ -623,6 +677,103 @@ def test_walk_layout(
     assert all([record[record_index] == expected for record in records])
 
 
+@pytest.mark.parametrize(
+    "filters, expected",
+    [
+        ({}, "root/*/*_*"),
+        ({"field_enum": "BLUE", "resolution": "HR"}, "root/BLUE/HR_*"),
+        ({"field_enum": ["BLUE", "RED"], "field_i": 12}, "root/*/*_*"),
+    ],
+)
+def test_layout_to_glob(layout: Layout, filters: dict[str, tp.Any], expected: str):
+    layout.set_filters(**filters)
+    assert layout.to_glob("root/") == expected
+
+
+def test_layout_to_glob_escape_root(layout: Layout):
+    layout.set_filters()
+    assert layout.to_glob("root[1]*?/") == "root[[]1][*][?]/*/*_*"
+
+
+def test_layout_to_glob_no_generation_string():
+    layout = Layout([FileNameConvention(re.compile("foo|bar"), [])])
+    assert layout.to_glob("root") is None
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [{}, {"field_enum": "BLUE"}, {"field_f": 5.6}, {"resolution": "HR"}],
+)
+def test_walk_glob(
+    layouts_v2: list[Layout],
+    filters: dict[str, tp.Any],
+    memory_root: Path,
+    memory_fs: MemoryFileSystem,
+):
+    for layout in layouts_v2:
+        layout.set_filters(**filters)
+    visitor = LayoutVisitor(
+        layouts_v2, on_mismatch_directory=LayoutMismatchHandling.IGNORE
+    )
+    root_str = (memory_root / "root").as_posix()
+    root_node = DirNode(root_str, {"name": root_str}, memory_fs, 0)
+
+    records = list(walk(root_node, visitor))
+    records_glob = list(walk_glob(root_node, visitor))
+    assert len(records) > 0
+    assert sorted(records_glob, key=lambda r: r[0]) == sorted(
+        records, key=lambda r: r[0]
+    )
+
+
+def test_walk_glob_fallback(
+    layouts_v2: list[Layout],
+    convention: FileNameConvention,
+    memory_root: Path,
+    memory_fs: MemoryFileSystem,
+):
+    # Directory convention without generation string
+    directory_convention = layouts_v2[1].conventions[0]
+    layout = Layout(
+        [
+            FileNameConvention(directory_convention.regex, directory_convention.fields),
+            convention,
+        ]
+    )
+    visitor = LayoutVisitor(
+        [layout], on_mismatch_directory=LayoutMismatchHandling.IGNORE
+    )
+    root_str = (memory_root / "root").as_posix()
+    root_node = DirNode(root_str, {"name": root_str}, memory_fs, 0)
+
+    assert list(walk_glob(root_node, visitor)) == list(walk(root_node, visitor))
+
+
+def test_walk_glob_special_characters_root(
+    layouts_v2: list[Layout],
+    filepaths: list[str],
+    memory_fs: MemoryFileSystem,
+):
+    # The same tree under a root with glob special characters, next to a
+    # sibling root matched by the unescaped pattern
+    root = Path("/myfc_glob[1]")
+    memory_fs.pipe({(root / filepath).as_posix(): b"" for filepath in filepaths})
+    memory_fs.pipe({f"/myfc_glob1/{filepaths[0]}": b""})
+
+    visitor = LayoutVisitor(
+        layouts_v2, on_mismatch_directory=LayoutMismatchHandling.IGNORE
+    )
+    root_str = (root / "root").as_posix()
+    root_node = DirNode(root_str, {"name": root_str}, memory_fs, 0)
+
+    records = list(walk(root_node, visitor))
+    records_glob = list(walk_glob(root_node, visitor))
+    assert len(records) > 0
+    assert sorted(records_glob, key=lambda r: r[0]) == sorted(
+        records, key=lambda r: r[0]
+    )
+
+
 @pytest.mark.parametrize(
     "path, level",
     [
@@ -646,7 +797,7 @@ def test_no_layout_visit_dir(
     result = visitor.visit_dir(node)
     assert result.explore_next is True
     assert result.payload is None
-    assert result.surviving_layouts == []
+    assert len(result.surviving_layouts) == 0
 
 
 @pytest.mark.parametrize(
@@ -673,7 +824,7 @@ def test_no_layout_visit_file(
 
     result = visitor.visit_file(node)
     assert not result.explore_next
-    assert result.surviving_layouts == []
+    assert len(result.surviving_layouts) == 0
 
     assert result.payload == (*expected_record, (memory_root / path).as_posix())
 
@@ -831,3 +982,17 @@ def test_collector_stat_fields_error(
     with pytest.raises(KeyError):
         collector, enable_layouts = collector_status
         collector.to_dataframe(enable_layouts=enable_layouts, stat_fields=("foo",))
+
+
+def test_collector_use_glob(
+    collector_status: tuple[FileSystemMetadataCollector, bool],
+):
+    collector, enable_layouts = collector_status
+    filters = dict(field_enum=Color.RED, field_f=1.75)
+    df = collector.to_dataframe(enable_layouts=enable_layouts, **filters)
+    df_glob = collector.to_dataframe(
+        enable_layouts=enable_layouts, use_glob=True, **filters
+    )
+    assert np.array_equal(
+        sorted(df["filename"].values), sorted(df_glob["filename"].values)
+    )
@@ -5,6 +5,8 @@ from pathlib import Path
 
 import pytest
 
+from ._common import link_or_copy
+
 if tp.TYPE_CHECKING:
     import xarray as xr_t
 
@@ -32,10 +34,15 @@ def chl_dir(
     """The test folder will contain multiple netcdf."""
     data_dir = Path(tmpdir_factory.mktemp("data"))
 
+    # All files share the same content: serialize the dataset once and link
+    # or copy the result
+    reference = data_dir / "reference.nc"
+    l4_ssha_dataset_0_360.to_netcdf(reference)
     for f in chl_files:
         path = data_dir.joinpath(f)
         path.parent.mkdir(parents=True, exist_ok=True)
-        l4_ssha_dataset_0_360.to_netcdf(path)
+        link_or_copy(reference, path)
+    reference.unlink()
 
     return data_dir
 
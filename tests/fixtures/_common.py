@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import os
+import shutil
+import typing as tp
+
+if tp.TYPE_CHECKING:
+    from pathlib import Path
+
+
+def materialize(root: Path, files: tp.Iterable[str]) -> Path:
+    # Create empty files, relative to the root folder. Each parent folder is
+    # created once and os.open avoids the extra utime call of Path.touch
+    created = set()
+    for file in files:
+        path = os.path.join(root, file)
+        parent = os.path.dirname(path)
+        if parent not in created:
+            os.makedirs(parent, exist_ok=True)
+            created.add(parent)
+        os.close(os.open(path, os.O_CREAT | os.O_WRONLY, 0o644))
+
+    return root
+
+
+def link_or_copy(source: Path, target: Path):
+    # Hard links are cheaper than a copy but are not allowed across file
+    # systems
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copyfile(source, target)
@@ -4,6 +4,8 @@ import typing as tp
 
 import pytest
 
+from ._common import materialize
+
 if tp.TYPE_CHECKING:
     from pathlib import Path
 
@@ -20,12 +22,4 @@ def dac_files() -> list[str]:
 
 @pytest.fixture(scope="session")
 def dac_dir(tmp_path_factory: pytest.TempPathFactory, dac_files: list[str]) -> Path:
-    # create test folder
-    test_dir = tmp_path_factory.mktemp("test_dir")
-
-    # create test files
-    for file in dac_files:
-        f = test_dir / file
-        f.touch()
-
-    return test_dir
+    return materialize(tmp_path_factory.mktemp("test_dir"), dac_files)
@@ -4,6 +4,8 @@ import typing as tp
 
 import pytest
 
+from ._common import materialize
+
 if tp.TYPE_CHECKING:
     from pathlib import Path
 
@@ -18,12 +20,4 @@ def era5_files() -> list[str]:
 
 @pytest.fixture(scope="session")
 def era5_dir(tmp_path_factory: pytest.TempPathFactory, era5_files: list[str]) -> Path:
-    # create test folder
-    test_dir = tmp_path_factory.mktemp("test_dir")
-
-    # create test files
-    for file in era5_files:
-        f = test_dir / file
-        f.touch()
-
-    return test_dir
+    return materialize(tmp_path_factory.mktemp("test_dir"), era5_files)
@@ -2,8 +2,8 @@ from __future__ import annotations
 
 import dataclasses as dc
 import functools
+import math
 import typing as tp
-from copy import copy, deepcopy
 
 import netCDF4 as nc4
 import numpy as np
@@ -20,8 +20,26 @@ def group_metadata_to_netcdf(
     group: GroupMetadata,
     generators: dict[str, tp.Callable[[tuple[int, ...]], np_t.NDArray[np.float64]]],
 ):
-    for name, value in group.attributes.items():
-        nds.setncattr(name, value)
+    # Define the whole tree (dimensions, variables, attributes) before writing
+    # any data so that the file is not switched back and forth between the
+    # define and data modes. The variables are filled in the definition order
+    # because the generators may be stateful
+    for var, variable, shape in _define_group(nds, group):
+        values = generators[variable.name](shape)
+        if np.issubdtype(values.dtype, np.dtype("M8")):
+            values = xr.coding.times.encode_cf_datetime(
+                values,
+                variable.attributes["units"],
+                variable.attributes["calendar"],
+                dtype=variable.dtype,
+            )[0]
+        var[...] = values
+
+
+def _define_group(
+    nds: nc4.Dataset | nc4.Group, group: GroupMetadata
+) -> list[tuple[nc4.Variable, VariableMetadata, list[int]]]:
+    nds.setncatts(group.attributes)
 
     for name, size in group.dimensions.items():
         nds.createDimension(name, size)
@@ -30,30 +48,27 @@ def group_metadata_to_netcdf(
     if nds.parent is not None:
         dimensions |= nds.parent.dimensions
 
+    definitions = []
     for variable in group.variables:
-        attributes = copy(variable.attributes)
-        fill_value = attributes.pop("_FillValue")
+        # The fill value can only be set when creating the variable
         var = nds.createVariable(
-            variable.name, variable.dtype, variable.dimensions, fill_value=fill_value
+            variable.name,
+            variable.dtype,
+            variable.dimensions,
+            fill_value=variable.attributes.get("_FillValue"),
+        )
+        var.setncatts(
+            {k: v for k, v in variable.attributes.items() if k != "_FillValue"}
         )
 
         shape = [dimensions[d].size for d in variable.dimensions]
-        values = generators[variable.name](shape)
-        if np.issubdtype(values.dtype, np.dtype("M8")):
-            values = xr.coding.times.encode_cf_datetime(
-                values,
-                variable.attributes["units"],
-                variable.attributes["calendar"],
-                dtype=variable.dtype,
-            )[0]
-        var[...] = values
-
-        for name, value in attributes.items():
-            var.setncattr(name, value)
+        definitions.append((var, variable, shape))
 
     for subgroup in group.subgroups:
         ngrp = nds.createGroup(subgroup.name)
-        group_metadata_to_netcdf(ngrp, subgroup, generators)
+        definitions.extend(_define_group(ngrp, subgroup))
+
+    return definitions
 
 
 def variable_metadata_to_xarray(
@@ -88,24 +103,16 @@ def group_metadata_to_xarray(
 
 def pluck(metadata: GroupMetadata, path: str) -> GroupMetadata:
 
-    attributes = {}
-    dimensions = {}
-    names = []
-    variables = []
-    for node in metadata.nodes(path):
-        names.append(node.name)
-        variables.extend(node.variables)
-        attributes |= node.attributes
-        dimensions |= node.dimensions
+    nodes = list(metadata.nodes(path))
 
-    node = deepcopy(node)
-    node.name = "/".join(names).lstrip("/")
-    node.variables = variables
-    node.subgroups = []
-    node.dimensions = dimensions
-    node.attributes = attributes
-
-    return node
+    # Deeper nodes override the attributes and dimensions of their parents
+    return GroupMetadata(
+        name="/".join(node.name for node in nodes).lstrip("/"),
+        variables=[v for node in nodes for v in node.variables],
+        subgroups=[],
+        attributes={k: v for node in nodes for k, v in node.attributes.items()},
+        dimensions={k: v for node in nodes for k, v in node.dimensions.items()},
+    )
 
 
 def _default_half_orbit_number_generator() -> (
@@ -177,21 +184,28 @@ class HalfOrbitTrackCoordinatesGenerator:
         return self._cycle_number, self._pass_number
 
     def time(self, shape: tuple[int, ...]) -> np_t.NDArray[np.datetime64]:
-        times = np.arange(self.t0, self.t0 + self.dt * shape[0], self.dt).astype(
-            "M8[ns]"
-        )
+        # Build the nanoseconds counts in place and reinterpret them as dates
+        # to avoid a conversion pass from the t0/dt units
+        times = np.arange(shape[0], dtype=np.int64)
+        times *= self.dt.astype("m8[ns]").astype(np.int64)
+        times += self.t0.astype("M8[ns]").astype(np.int64)
+        times = times.view("M8[ns]")
         self._t1 = times[-1]
         self._dt_pass = self._t1 - self.t0
         return times
 
     def longitude(self, shape: tuple[int, ...]) -> np_t.NDArray[np.float64]:
-        longitudes = np.tan(
-            np.linspace(
-                -np.pi / 2 + self.epsilon_lon, np.pi / 2 - self.epsilon_lon, shape[0]
-            )
+        # Evaluate the functions in place to avoid allocating a second array
+        longitudes = np.linspace(
+            -np.pi / 2 + self.epsilon_lon, np.pi / 2 - self.epsilon_lon, shape[0]
         )
-        longitudes *= self.dlon / (longitudes[-1] - longitudes[0])
-        longitudes += self.lon0 - longitudes[0]
+        np.tan(longitudes, out=longitudes)
+        # tan is odd, the curve spans [-tan_max, tan_max] and is mapped to
+        # [lon0, lon0 + dlon]
+        tan_max = math.tan(math.pi / 2 - self.epsilon_lon)
+        scale = self.dlon / (2 * tan_max)
+        longitudes *= scale
+        longitudes += self.lon0 + tan_max * scale
         longitudes %= 360
 
         if len(shape) > 1:
@@ -200,22 +214,23 @@ class HalfOrbitTrackCoordinatesGenerator:
         return longitudes
 
     def latitude(self, shape: tuple[int, ...]) -> np_t.NDArray[np.float64]:
-        latitudes = np.sin(
-            np.linspace(
-                np.pi / 2 + self.epsilon_lat, 3 * np.pi / 2 - self.epsilon_lat, shape[0]
-            )
+        latitudes = np.linspace(
+            np.pi / 2 + self.epsilon_lat, 3 * np.pi / 2 - self.epsilon_lat, shape[0]
         )
-        latitudes *= self.lat0 / abs(np.max(latitudes))
+        np.sin(latitudes, out=latitudes)
+        # sin is decreasing on the interval, its maximum is the first value
+        latitudes *= self.lat0 / math.cos(self.epsilon_lat)
         if len(shape) > 1:
             latitudes = np.broadcast_to(latitudes[:, None], shape)
 
         return latitudes
 
     def cycle_number(self, shape: tuple[int, ...]) -> np_t.NDArray[np.int64]:
-        return np.full(shape, self._cycle_number)
+        # Constant values, a read-only view is enough
+        return np.broadcast_to(np.int64(self._cycle_number), shape)
 
     def pass_number(self, shape: tuple[int, ...]) -> np_t.NDArray[np.int64]:
-        return np.full(shape, self._pass_number)
+        return np.broadcast_to(np.int64(self._pass_number), shape)
 
     def __getitem__(
         self, key: str
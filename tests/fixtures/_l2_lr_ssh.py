@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import copy
+import functools
 import typing as tp
 from pathlib import Path
 
@@ -11,6 +12,7 @@ import xarray as xr
 from fcollections.core import GroupMetadata, VariableMetadata
 from fcollections.geometry import query_geometries
 
+from ._common import link_or_copy, materialize
 from ._generation import (
     HalfOrbitTrackCoordinatesGenerator,
     group_metadata_to_xarray,
@@ -39,15 +41,16 @@ def _l2_lr_ssh_basic_metadata() -> GroupMetadata:
 class BasicGenerator(HalfOrbitTrackCoordinatesGenerator):
 
     def ssha_karin_2(self, shape: tuple[int, ...]) -> np_t.NDArray[np.float64]:
-        return np.random.random(shape)
+        return self._random_generator.random(shape)
 
 
+@functools.lru_cache(maxsize=None)
 def _swath_properties(
     pass_number: int, phase: str = "calval"
 ) -> tuple[float, float, float]:
     polygon = query_geometries(pass_number, phase).geometry.values[0]
-    xx, yy = polygon.exterior.coords.xy
-    xx, yy = np.array(xx.tolist()), np.array(yy.tolist())
+    coords = np.asarray(polygon.exterior.coords)
+    xx, yy = coords[:, 0], coords[:, 1]
 
     return xx[0], np.max(xx - xx[0]), yy[0]
 
@@ -84,14 +87,11 @@ class ExpertGenerator(BasicGenerator):
 
     def cross_track_distance(self, shape: tuple[int, int]) -> np_t.NDArray[np.float64]:
         num_lines, num_pixels = shape
-        return (
-            np.repeat(
-                np.arange(-(num_pixels - 1) * 1000, num_pixels * 1000 + 1, 2000),
-                num_lines,
-            )
-            .reshape(num_pixels, num_lines)
-            .T
+        # All lines share the same distances, a read-only view is enough
+        row = np.arange(
+            -(num_pixels - 1) * 1000, num_pixels * 1000 + 1, 2000, dtype=np.float64
         )
+        return np.broadcast_to(row, (num_lines, num_pixels))
 
 
 @pytest.fixture(scope="session")
@@ -142,32 +142,17 @@ def l2_lr_ssh_files() -> list[str]:
 def l2_lr_ssh_dir_empty_files(
     tmp_path_factory: pytest.TempPathFactory, l2_lr_ssh_files: list[str]
 ) -> Path:
-    root = tmp_path_factory.mktemp("l2_lr_ssh")
-
-    # create test folder
-    for filepath in l2_lr_ssh_files:
-        filepath = root / Path(filepath).name
-
-        filepath.parent.mkdir(parents=True, exist_ok=True)
-        filepath.touch()
-
-    return root
+    return materialize(
+        tmp_path_factory.mktemp("l2_lr_ssh"),
+        [Path(filepath).name for filepath in l2_lr_ssh_files],
+    )
 
 
 @pytest.fixture(scope="session")
 def l2_lr_ssh_dir_empty_files_layout(
     tmp_path_factory: pytest.TempPathFactory, l2_lr_ssh_files: list[str]
 ) -> Path:
-    root = tmp_path_factory.mktemp("l2_lr_ssh")
-
-    # create test folder
-    for filepath in l2_lr_ssh_files:
-        filepath = root / Path(filepath)
-
-        filepath.parent.mkdir(parents=True, exist_ok=True)
-        filepath.touch()
-
-    return root
+    return materialize(tmp_path_factory.mktemp("l2_lr_ssh"), l2_lr_ssh_files)
 
 
 @pytest.fixture(scope="session")
@@ -180,23 +165,33 @@ def l2_lr_ssh_dir(
 ):
 
     # Create fake data for the netcdf files, do not just use touch() to simulate
-    # the file tree
+    # the file tree. All the files of a given kind hold the same dataset: it is
+    # serialized once and the other files are linked to this first write
     root_dir = Path(tmpdir_factory.mktemp("l3_lr_ssh"))
+    written: dict[str, Path] = {}
     for file in l2_lr_ssh_files:
-        relative_path = Path(file)
-        if "Basic" in relative_path.name:
-            path = root_dir / "basic" / relative_path.name
-            path.parent.mkdir(parents=True, exist_ok=True)
+        name = Path(file).name
+        if "Basic" in name:
+            kind = "basic"
+        elif "Expert" in name:
+            kind = "expert"
+        else:
+            kind = "unsmoothed"
+
+        path = root_dir / kind / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if kind in written:
+            link_or_copy(written[kind], path)
+            continue
+
+        if kind == "basic":
             l2_lr_ssh_basic_dataset.to_netcdf(path)
-        elif "Expert" in relative_path.name:
-            path = root_dir / "expert" / relative_path.name
-            path.parent.mkdir(parents=True, exist_ok=True)
+        elif kind == "expert":
             l2_lr_ssh_expert_dataset.to_netcdf(path)
         else:
-            path = root_dir / "unsmoothed" / relative_path.name
-            path.parent.mkdir(parents=True, exist_ok=True)
             l2_lr_ssh_unsmoothed_dataset.to_netcdf(path, group="left")
             l2_lr_ssh_unsmoothed_dataset.to_netcdf(path, group="right", mode="a")
+        written[kind] = path
 
     return root_dir
 
@@ -11,6 +11,7 @@ import xarray as xr
 
 from fcollections.core import GroupMetadata, VariableMetadata
 
+from ._common import materialize
 from ._generation import (
     HalfOrbitTrackCoordinatesGenerator,
     group_metadata_to_xarray,
@@ -174,32 +175,17 @@ def l3_lr_ssh_files() -> list[str]:
 def l3_lr_ssh_dir_empty_files(
     tmp_path_factory: pytest.TempPathFactory, l3_lr_ssh_files: list[str]
 ) -> Path:
-    root = tmp_path_factory.mktemp("l3_lr_ssh")
-
-    # create test folder
-    for filepath in l3_lr_ssh_files:
-        filepath = root / Path(filepath).name
-
-        filepath.parent.mkdir(parents=True, exist_ok=True)
-        filepath.touch()
-
-    return root
+    return materialize(
+        tmp_path_factory.mktemp("l3_lr_ssh"),
+        [Path(filepath).name for filepath in l3_lr_ssh_files],
+    )
 
 
 @pytest.fixture(scope="session")
 def l3_lr_ssh_dir_empty_files_layout(
     tmp_path_factory: pytest.TempPathFactory, l3_lr_ssh_files: list[str]
 ) -> Path:
-    root = tmp_path_factory.mktemp("l3_lr_ssh")
-
-    # create test folder
-    for filepath in l3_lr_ssh_files:
-        filepath = root / filepath
-
-        filepath.parent.mkdir(parents=True, exist_ok=True)
-        filepath.touch()
-
-    return root
+    return materialize(tmp_path_factory.mktemp("l3_lr_ssh"), l3_lr_ssh_files)
 
 
 @pytest.fixture(scope="session")
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 import typing as tp
 from pathlib import Path
 
@@ -7,6 +8,8 @@ import numpy as np
 import pytest
 import xarray as xr
 
+from ._common import materialize
+
 if tp.TYPE_CHECKING:
     import numpy.typing as np_t
 
@@ -17,13 +20,13 @@ def _build_grid(
     lon_name: str = "longitude",
     lat_name: str = "latitude",
 ) -> xr.Dataset:
-    np.random.seed(0)
     time = np.arange("2024-01-01T12", "2024-01-01T18", dtype="M8[h]")
 
     sla = (np.arange(lon.size * lat.size) / (lon.size * lat.size)).reshape(
         lon.size, lat.size
     )
-    sla = np.repeat(sla, time.size).reshape(time.size, *sla.shape)
+    # Same map for every time step
+    sla = np.broadcast_to(sla, (time.size, *sla.shape))
     ds = xr.Dataset(
         data_vars=dict(
             time=("time", time.astype("M8[ns]")),
@@ -71,19 +74,17 @@ def l4_ssha_files() -> list[str]:
     ]
 
 
+@pytest.fixture(scope="session")
+def l4_ssha_basenames(l4_ssha_files: list[str]) -> list[str]:
+    # Listing results are compared on the file names, indexed like the files
+    return [os.path.basename(f) for f in l4_ssha_files]
+
+
 @pytest.fixture(scope="session")
 def l4_ssha_dir(
     tmp_path_factory: pytest.TempPathFactory, l4_ssha_files: list[str]
 ) -> Path:
-    root = tmp_path_factory.mktemp("l4_karin_nadir")
-
-    # create test folder
-    for filepath in l4_ssha_files:
-        filepath = root / filepath
-
-        filepath.parent.mkdir(parents=True, exist_ok=True)
-        filepath.touch()
-    return root
+    return materialize(tmp_path_factory.mktemp("l4_karin_nadir"), l4_ssha_files)
 
 
 @pytest.fixture(scope="session")
@@ -4,6 +4,8 @@ import typing as tp
 
 import pytest
 
+from ._common import materialize
+
 if tp.TYPE_CHECKING:
     from pathlib import Path
 
@@ -18,12 +20,4 @@ def mur_files() -> list[str]:
 
 @pytest.fixture(scope="session")
 def mur_dir(tmp_path_factory: pytest.TempPathFactory, mur_files: list[str]) -> Path:
-    # create test folder
-    test_dir = tmp_path_factory.mktemp("test_dir")
-
-    # create test files
-    for file in mur_files:
-        f = test_dir / file
-        f.touch()
-
-    return test_dir
+    return materialize(tmp_path_factory.mktemp("test_dir"), mur_files)
@@ -7,6 +7,8 @@ import numpy as np
 import pytest
 import xarray as xr
 
+from ._common import link_or_copy, materialize
+
 if tp.TYPE_CHECKING:
     from pathlib import Path
 
@@ -19,21 +21,17 @@ def _build_along_track(
     lon_name: str = "longitude",
     lat_name: str = "latitude",
 ) -> xr.Dataset:
-    np.random.seed(0)
-    ds = xr.Dataset()
-
-    ds[lon_name] = (["time"], lon)
-    ds[lat_name] = (["time"], lat)
-
     time = np.arange("2024-01-01T12", "2024-01-01T16", dtype="M8[h]")
-    ds["time"] = (
-        ["time"],
-        time.astype("datetime64[ns]"),
+    sla = np.random.default_rng(0).random(lon.size, dtype=np.float32)
+
+    return xr.Dataset(
+        data_vars={"sla": (["time"], sla)},
+        coords={
+            lon_name: (["time"], lon),
+            lat_name: (["time"], lat),
+            "time": (["time"], time.astype("datetime64[ns]")),
+        },
     )
-    sla = np.random.random(lon.size)
-    ds["sla"] = (["time"], sla)
-    ds = ds.set_coords([lon_name, lat_name, "time"]).astype(np.float32)
-    return ds
 
 
 @pytest.fixture(scope="session")
@@ -69,32 +67,19 @@ def l3_nadir_files() -> list[str]:
 def l3_nadir_dir_no_layout(
     tmp_path_factory: pytest.TempPathFactory, l3_nadir_files: list[str]
 ) -> Path:
-    root = tmp_path_factory.mktemp("SEALEVEL_GLO_PHY_L3_NRT_008_044")
-
-    # create test folder
-    for filepath in l3_nadir_files:
-        filepath = root / Path(filepath).name
-
-        filepath.parent.mkdir(parents=True, exist_ok=True)
-        filepath.touch()
-
-    return root
+    return materialize(
+        tmp_path_factory.mktemp("SEALEVEL_GLO_PHY_L3_NRT_008_044"),
+        [Path(filepath).name for filepath in l3_nadir_files],
+    )
 
 
 @pytest.fixture(scope="session")
 def l3_nadir_dir_layout(
     tmp_path_factory: pytest.TempPathFactory, l3_nadir_files: list[str]
 ) -> Path:
-    root = tmp_path_factory.mktemp("SEALEVEL_GLO_PHY_L3_NRT_008_044")
-
-    # create test folder
-    for filepath in l3_nadir_files:
-        filepath = root / filepath
-
-        filepath.parent.mkdir(parents=True, exist_ok=True)
-        filepath.touch()
-
-    return root
+    return materialize(
+        tmp_path_factory.mktemp("SEALEVEL_GLO_PHY_L3_NRT_008_044"), l3_nadir_files
+    )
 
 
 @pytest.fixture(scope="session")
@@ -115,10 +100,12 @@ def l3_nadir_dir(
     # create test folder
     test_dir = tmp_path_factory.mktemp("test_dir")
 
-    # create test files
-    for file in l3_nadir_files_2:
-        f = test_dir / file
-        l3_nadir_dataset_0_360.to_netcdf(f)
+    # create test files. They share the same content: serialize the dataset
+    # once and link the other files to it
+    first, *others = (test_dir / file for file in l3_nadir_files_2)
+    l3_nadir_dataset_0_360.to_netcdf(first)
+    for f in others:
+        link_or_copy(first, f)
 
     return test_dir
 
@@ -136,12 +123,4 @@ def l2_nadir_files() -> list[str]:
 def l2_nadir_dir(
     tmp_path_factory: pytest.TempPathFactory, l2_nadir_files: list[str]
 ) -> Path:
-    # create test folder
-    test_dir = tmp_path_factory.mktemp("test_dir")
-
-    # create test files
-    for file in l2_nadir_files:
-        f = test_dir / file
-        f.touch()
-
-    return test_dir
+    return materialize(tmp_path_factory.mktemp("test_dir"), l2_nadir_files)
@@ -4,6 +4,8 @@ import typing as tp
 
 import pytest
 
+from ._common import materialize
+
 if tp.TYPE_CHECKING:
     from pathlib import Path
 
@@ -17,12 +19,4 @@ def ohc_files() -> list[str]:
 
 @pytest.fixture(scope="session")
 def ohc_dir(tmp_path_factory: pytest.TempPathFactory, ohc_files: list[str]) -> Path:
-    # create test folder
-    test_dir = tmp_path_factory.mktemp("test_dir")
-
-    # create test files
-    for file in ohc_files:
-        f = test_dir / file
-        f.touch()
-
-    return test_dir
+    return materialize(tmp_path_factory.mktemp("test_dir"), ohc_files)
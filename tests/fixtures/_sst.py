@@ -4,6 +4,8 @@ import typing as tp
 
 import pytest
 
+from ._common import materialize
+
 if tp.TYPE_CHECKING:
     from pathlib import Path
 
@@ -22,16 +24,7 @@ def sst_files() -> list[str]:
 
 @pytest.fixture(scope="session")
 def sst_dir(tmp_path_factory: pytest.TempPathFactory, sst_files: list[str]) -> Path:
-    # create test folder
-    test_dir = tmp_path_factory.mktemp("test_dir")
-
-    # create test files
-    for file in sst_files:
-        f = test_dir / file
-        f.parent.mkdir(parents=True, exist_ok=True)
-        f.touch()
-
-    return test_dir
+    return materialize(tmp_path_factory.mktemp("test_dir"), sst_files)
 
 
 @pytest.fixture(scope="session")
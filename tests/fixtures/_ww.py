@@ -10,6 +10,7 @@ import numpy as np
 import pytest
 import xarray as xr
 
+from ._common import materialize
 from ._generation import (
     HalfOrbitTrackCoordinatesGenerator,
     group_metadata_to_netcdf,
@@ -48,16 +49,17 @@ def _decimate_dimension(group: GroupMetadata):
         pass
 
 
-@pytest.fixture(scope="session")
-def _light_metadata(resources_directory: Path) -> GroupMetadata:
-    path = resources_directory / "L3_LR_WIND_WAVE_Light_2.0"
-    with path.open(mode="rb") as f:
-        metadata = pickle.load(f)
-
+def _load_metadata(path: Path) -> GroupMetadata:
+    metadata = pickle.loads(path.read_bytes())
     metadata.apply(_decimate_dimension)
     return metadata
 
 
+@pytest.fixture(scope="session")
+def _light_metadata(resources_directory: Path) -> GroupMetadata:
+    return _load_metadata(resources_directory / "L3_LR_WIND_WAVE_Light_2.0")
+
+
 @pytest.fixture(scope="session")
 def l3_lr_ww_light_files(
     tmp_path_factory: pytest.TempPathFactory, _light_metadata: GroupMetadata
@@ -72,7 +74,8 @@ def l3_lr_ww_light_files(
 
     generator = LightExtendedSubsetGenerator()
     for light_file in light_files:
-        with nc4.Dataset(light_file, mode="w") as nds:
+        # Small files: build them in memory and flush them in one go on close
+        with nc4.Dataset(light_file, mode="w", diskless=True, persist=True) as nds:
             group_metadata_to_netcdf(nds, _light_metadata, generator)
             next(generator)
     return light_files
@@ -86,11 +89,7 @@ def l3_lr_ww_light_dataset(_light_metadata: GroupMetadata) -> xr.Dataset:
 
 @pytest.fixture(scope="session")
 def _extended_metadata(resources_directory: Path) -> GroupMetadata:
-    path = resources_directory / "L3_LR_WIND_WAVE_Extended_2.0"
-    with path.open(mode="rb") as f:
-        metadata = pickle.load(f)
-    metadata.apply(_decimate_dimension)
-    return metadata
+    return _load_metadata(resources_directory / "L3_LR_WIND_WAVE_Extended_2.0")
 
 
 @pytest.fixture(scope="session")
@@ -107,7 +106,8 @@ def l3_lr_ww_extended_files(
 
     generator = LightExtendedSubsetGenerator()
     for extended_file in files:
-        with nc4.Dataset(extended_file, mode="w") as nds:
+        # Small files: build them in memory and flush them in one go on close
+        with nc4.Dataset(extended_file, mode="w", diskless=True, persist=True) as nds:
             group_metadata_to_netcdf(nds, _extended_metadata, generator)
             next(generator)
     return files
@@ -136,13 +136,4 @@ def l3_lr_ww_files() -> list[str]:
 def l3_lr_ww_dir_layout(
     tmp_path_factory: pytest.TempPathFactory, l3_lr_ww_files: list[str]
 ) -> Path:
-    root = tmp_path_factory.mktemp("l2_lr_ssh")
-
-    # create test folder
-    for filepath in l3_lr_ww_files:
-        filepath = root / filepath
-
-        filepath.parent.mkdir(parents=True, exist_ok=True)
-        filepath.touch()
-
-    return root
+    return materialize(tmp_path_factory.mktemp("l2_lr_ssh"), l3_lr_ww_files)
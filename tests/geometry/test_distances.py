@@ -16,7 +16,7 @@ if tp.TYPE_CHECKING:
 
 
 @pytest.fixture(scope="session")
-def positions() -> list[tuple[float, float]]:
+def positions() -> np_t.NDArray[np.float64]:
     # ((2, 21, 7.9199999999994475, 'E'), (48, 51, 23.7600000000009, 'N'))
     paris = 2.3522, 48.8566
     # ((139, 41, 30.11999999999034, 'E'), (35, 41, 22.2000000000088, 'N'))
@@ -24,19 +24,22 @@ def positions() -> list[tuple[float, float]]:
     # ((70, 40, 9.480000000024802, 'W'), (33, 26, 56.04000000000667, 'S'))
     santiago = -70.6693, -33.4489
 
-    return [paris, tokyo, santiago]
+    # One contiguous row for the longitudes and one for the latitudes
+    return np.array([paris, tokyo, santiago], dtype=np.float64).T.copy()
 
 
 def fractional_to_degree_minute_second(lon, lat):
-    # Useful to convert to a format compatible with online calculators
-    lat_direction = "N" if lon > 0 else "S"
-    lon_direction = "E" if lon > 0 else "W"
-    lon, lat = abs(lon), abs(lat)
+    # Useful to convert to a format compatible with online calculators. Works
+    # on scalars and arrays alike
+    lon, lat = np.asarray(lon, dtype=np.float64), np.asarray(lat, dtype=np.float64)
+    lat_direction = np.where(lat > 0, "N", "S")
+    lon_direction = np.where(lon > 0, "E", "W")
 
     def to_dms(x):
-        degrees = int(x)
+        x = np.abs(x)
+        degrees = x.astype(np.int64)
         minutes_fractional = (x - degrees) * 60
-        minutes = int(minutes_fractional)
+        minutes = minutes_fractional.astype(np.int64)
         seconds = (minutes_fractional - minutes) * 60
         return degrees, minutes, seconds
 
@@ -44,13 +47,13 @@ def fractional_to_degree_minute_second(lon, lat):
 
 
 @pytest.fixture(scope="session")
-def latitudes(positions: list[tuple[float, float]]) -> np_t.NDArray[np.float64]:
-    return np.array([p[1] for p in positions])
+def latitudes(positions: np_t.NDArray[np.float64]) -> np_t.NDArray[np.float64]:
+    return positions[1]
 
 
 @pytest.fixture(scope="session")
-def longitudes(positions: list[tuple[float, float]]) -> np_t.NDArray[np.float64]:
-    return np.array([p[0] for p in positions])
+def longitudes(positions: np_t.NDArray[np.float64]) -> np_t.NDArray[np.float64]:
+    return positions[0]
 
 
 @pytest.fixture(scope="session")
@@ -75,8 +78,8 @@ def test_great_circle_distances_axis(
     longitudes: np_t.NDArray[np.float64],
     latitudes: np_t.NDArray[np.float64],
 ):
-    longitudes_2d = np.broadcast_to(longitudes[:, None], (longitudes.size, 10))
-    latitudes_2d = np.broadcast_to(latitudes[:, None], (longitudes.size, 10))
+    longitudes_2d = np.repeat(longitudes[:, None], 10, axis=1)
+    latitudes_2d = np.repeat(latitudes[:, None], 10, axis=1)
 
     distances = _great_circle_distance_along_axis(longitudes, latitudes)
     computed = _great_circle_distance_along_axis(longitudes_2d, latitudes_2d)
@@ -98,8 +101,8 @@ def test_spheroid_distances_along_axis_axis(
     longitudes: np_t.NDArray[np.float64],
     latitudes: np_t.NDArray[np.float64],
 ):
-    longitudes_2d = np.broadcast_to(longitudes[:, None], (longitudes.size, 10))
-    latitudes_2d = np.broadcast_to(latitudes[:, None], (longitudes.size, 10))
+    longitudes_2d = np.repeat(longitudes[:, None], 10, axis=1)
+    latitudes_2d = np.repeat(latitudes[:, None], 10, axis=1)
 
     distances = _spheroid_distances_along_axis(longitudes, latitudes)
     computed = _spheroid_distances_along_axis(longitudes_2d, latitudes_2d)
@@ -119,8 +122,8 @@ def test_distances_along_axis_no_padding(
     longitudes: np_t.NDArray[np.float64], latitudes: np_t.NDArray[np.float64]
 ):
     # Build more points
-    longitudes = np.concatenate([longitudes, longitudes])
-    latitudes = np.concatenate([latitudes, latitudes])
+    longitudes = np.tile(longitudes, 2)
+    latitudes = np.tile(latitudes, 2)
 
     distances_great_circle = distances_along_axis(
         longitudes, latitudes, return_full=False
@@ -139,8 +142,8 @@ def test_distances_along_axis_padding(
     longitudes: np_t.NDArray[np.float64], latitudes: np_t.NDArray[np.float64]
 ):
     # Build more points
-    longitudes = np.concatenate([longitudes, longitudes])
-    latitudes = np.concatenate([latitudes, latitudes])
+    longitudes = np.tile(longitudes, 2)
+    latitudes = np.tile(latitudes, 2)
 
     distances = distances_along_axis(longitudes, latitudes, return_full=True)
     assert distances.size == 6
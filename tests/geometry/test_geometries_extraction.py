@@ -6,7 +6,8 @@ from fcollections.geometry import SwathGeometriesBuilder
 
 
 def build_fake_swath(pass_number=2, lon0=None, num_lines=9860, num_pixels=69):
-    np.random.seed(pass_number)
+    # Local generator: do not touch numpy's global random state
+    rng = np.random.default_rng(pass_number)
 
     if lon0 is None:
         lon0 = 67 + pass_number * 166
@@ -32,26 +33,24 @@ def build_fake_swath(pass_number=2, lon0=None, num_lines=9860, num_pixels=69):
 
     # création data
     shape = ds.longitude.shape
-    start = np.zeros(shape, dtype=np.float32)
+    start = np.zeros(shape)
 
     start[:3, :] = np.nan
     start[-3:, :] = np.nan
 
-    dx = (np.random.normal(size=shape[0])) * (1 / num_lines)
+    noise = rng.standard_normal(shape[0] + shape[1])
+    dx = noise[: shape[0]] * (1 / num_lines)
     dx = np.cumsum(dx)
     dx = np.convolve(dx, np.ones(11), mode="same")
 
-    dx = np.tile(dx, (shape[1], 1)).T
+    start += dx[:, None]
 
-    start = start + dx
-
-    dy = (np.random.normal(size=shape[1])) * (1 / num_lines) * 2
+    dy = noise[shape[0] :] * (1 / num_lines) * 2
 
     dy = np.cumsum(dy)
     dy = np.convolve(dy, np.ones(3), mode="same")
-    dy = np.tile(dy, (shape[0], 1))
 
-    start = start + dy
+    start += dy[None, :]
 
     ds["sla"] = (["num_lines", "num_pixels"], start)
     ds["pass_number"] = (
@@ -74,8 +73,9 @@ def builder():
     return SwathGeometriesBuilder()
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def ds_karin():
+    # The tests only read the swath, it can be shared
     return build_fake_swath()
 
 
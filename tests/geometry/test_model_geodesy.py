@@ -85,10 +85,10 @@ def test_normalize_and_split(convention, array, expected_arr):
     conv = LongitudeConvention(*convention)
     arr = conv.normalize_and_split(np.array(array))
 
-    assert np.array_equal(arr[0], np.array(expected_arr[0]))
-
-    if len(arr) > 1:
-        assert np.array_equal(arr[1], np.array(expected_arr[1]))
+    # array_equal converts the expected lists itself
+    assert len(arr) == len(expected_arr)
+    for actual, expected in zip(arr, expected_arr):
+        assert np.array_equal(actual, expected)
 
 
 @pytest.mark.parametrize(
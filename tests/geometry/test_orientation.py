@@ -45,22 +45,14 @@ def test_rotate_derivatives():
 
     x, y = rotate_vector(X, Y, -np.pi / 4)
 
-    dvx_dx_ref = sp.lambdify((xx, yy), dvx_dx)(x, y)
-    dvx_dy_ref = sp.lambdify((xx, yy), dvx_dy)(x, y)
-    dvy_dx_ref = sp.lambdify((xx, yy), dvy_dx)(x, y)
-    dvy_dy_ref = sp.lambdify((xx, yy), dvy_dy)(x, y)
-
-    vx = sp.lambdify((xx, yy), vx)(x, y)
-    vy = sp.lambdify((xx, yy), vy)(x, y)
+    # A single generated function evaluates all the expressions
+    dvx_dx_ref, dvx_dy_ref, dvy_dx_ref, dvy_dy_ref, vx, vy = sp.lambdify(
+        (xx, yy), [dvx_dx, dvx_dy, dvy_dx, dvy_dy, vx, vy], "numpy"
+    )(x, y)
     vX, vY = rotate_vector(vx, vy, np.pi / 4)
 
-    dvX_dX, dvX_dY = np.gradient(vX)
-    dvY_dX, dvY_dY = np.gradient(vY)
-
-    dvX_dX /= step
-    dvX_dY /= step
-    dvY_dY /= step
-    dvY_dX /= step
+    dvX_dX, dvX_dY = np.gradient(vX, step)
+    dvY_dX, dvY_dY = np.gradient(vY, step)
 
     dvx_dx, dvy_dy, dvx_dy, dvy_dx = rotate_derivatives(
         dvX_dX, dvY_dY, dvX_dY, dvY_dX, np.pi / 4
@@ -100,3 +92,12 @@ def test_track_orientation(
 ):
     angle = track_orientation(latitudes, longitudes)
     assert angle[0] == expected_angle
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_track_orientation_dtype(dtype: type):
+    latitudes = np.array([0, 1, 2, 3], dtype=dtype)
+    longitudes = np.array([0, 1, 2, 3], dtype=dtype)
+    angle = track_orientation(latitudes, longitudes)
+    assert angle.dtype == dtype
+    assert np.allclose(angle[1:-1], np.pi / 4, atol=1e-2)
@@ -63,3 +63,11 @@ def test_query_half_orbits_intersect(phase, bbox, result_passes):
 def test_query_half_orbits_intersect_none(phase, bbox):
     passes = query_half_orbits_intersect(bbox, phase)
     assert passes.empty
+
+
+def test_query_geometries_cached_footprints():
+    # The footprints are loaded once, the returned selections must not share
+    # their data with the cached frame
+    swath_geom = query_geometries([25, 26], "calval")
+    swath_geom.loc[:, "pass_number"] = 0
+    assert sorted(query_geometries([25, 26], "calval").pass_number) == [25, 26]
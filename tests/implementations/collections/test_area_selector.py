@@ -3,12 +3,17 @@ from __future__ import annotations
 import numpy as np
 import pytest
 import xarray as xr
-from utils import brute_force_geographical_selection, extract_box_from_polygon
+from utils import (
+    assert_dataset_equal_fast,
+    brute_force_geographical_selection,
+    extract_box_from_polygon,
+)
 
 from fcollections.implementations.optional._area_selectors import (
     AreaSelector2D,
     SwathAreaSelector,
     TemporalSerieAreaSelector,
+    _is_ascending,
     _select_2d_indices_intersect_bounds,
     _select_slices_intersect_bounds,
 )
@@ -46,6 +51,13 @@ def test_select_2d_indices_intersect_bounds(x_bounds, y_bounds, result):
     assert tuple(np.unique(ind_x)) == result
 
 
+def test_select_2d_indices_intersect_bounds_input_untouched():
+    x_arr = np.array([[2, 3, 4], [3, 4, 5]])
+    y_arr = np.array([[3, 2.5, 2], [5, 4.5, 4]])
+    _select_2d_indices_intersect_bounds(x_arr, y_arr, (5, 2), (1, 6))
+    assert np.array_equal(x_arr, [[2, 3, 4], [3, 4, 5]])
+
+
 def test_select_2d_indices_intersect_bounds_error():
     x_bounds, y_bounds = (4, 5), (4, 3)
     x_arr = np.array([[2, 3, 4], [3, 4, 5]])
@@ -54,6 +66,36 @@ def test_select_2d_indices_intersect_bounds_error():
         _select_2d_indices_intersect_bounds(x_arr, y_arr, x_bounds, y_bounds)
 
 
+def test_select_2d_indices_intersect_bounds_shape_mismatch():
+    x_arr = np.array([[2, 3, 4], [3, 4, 5]])
+    y_arr = np.array([3, 2.5])
+    with pytest.raises(ValueError):
+        _select_2d_indices_intersect_bounds(x_arr, y_arr, (2, 4), (2, 4))
+
+
+def test_select_2d_indices_intersect_bounds_broadcast():
+    x_arr = np.array([[2, 3, 4], [3, 4, 5]])
+    y_arr = np.array([[3], [5]])
+    ind = _select_2d_indices_intersect_bounds(x_arr, y_arr, (3, 4), (2, 4))
+    assert np.array_equal(ind, [[0, 0], [1, 2]])
+
+
+@pytest.mark.parametrize(
+    "array",
+    [
+        [-2, -1, 0, 1, 2],
+        [4, 3, 2, 1, 0],
+        [0, 1, 1, 2],
+        [0, 1, 0],
+        [0.0, np.nan, 1.0],
+        [0.0],
+    ],
+)
+def test_is_ascending(array):
+    array = np.array(array)
+    assert _is_ascending(array) == np.all(array[:-1] <= array[1:])
+
+
 class Test_select_slice_intersect_bounds:
 
     @pytest.mark.parametrize(
@@ -265,7 +307,9 @@ class Test_SwathAreaSelector:
         selector = SwathAreaSelector()
         ds = selector.apply(l2_lr_ssh_basic_dataset, bbox)
 
-        assert reference == ds
+        # The brute force selection masks the pixels outside the box, only the
+        # selected lines can be compared
+        assert_dataset_equal_fast(reference, ds, ["time"])
 
     @pytest.mark.parametrize("bbox", [(50, -50, 60, 0)])
     def test_apply_unsmoothed_sorted_time(
@@ -294,7 +338,9 @@ class Test_SwathAreaSelector:
         bbox = bbox[0], bbox[1], bbox[2] - 360, bbox[3]
         ds = selector.apply(l2_lr_ssh_basic_dataset, bbox)
 
-        assert reference == ds
+        # The brute force selection masks the pixels outside the box, only the
+        # selected lines can be compared
+        assert_dataset_equal_fast(reference, ds, ["time"])
 
     @pytest.mark.parametrize("bbox", [(-180, -90, 180, 90), (-179, -90, 179, 90)])
     def test_apply_global(
@@ -305,7 +351,9 @@ class Test_SwathAreaSelector:
         selector = SwathAreaSelector()
         ds = selector.apply(l2_lr_ssh_basic_dataset, bbox)
 
-        assert ds == l2_lr_ssh_basic_dataset
+        assert_dataset_equal_fast(
+            ds, l2_lr_ssh_basic_dataset, ["time", "longitude", "latitude"]
+        )
 
     @pytest.mark.parametrize("latitude", [-75, -30, 0, 30, 75])
     def test_apply_box_too_small(
@@ -232,7 +232,7 @@ class TestLayout:
     def test_list_layout_aviso(
         self,
         l4_ssha_dir_layout_aviso: Path,
-        l4_ssha_files: list[str],
+        l4_ssha_basenames: list[str],
         expected: list[int],
         filters: dict[str, tp.Any],
     ):
@@ -249,7 +249,7 @@ class TestLayout:
         actual = {
             os.path.basename(f) for f in collector.to_dataframe(**filters).filename
         }
-        expected = {os.path.basename(l4_ssha_files[ii]) for ii in expected}
+        expected = {l4_ssha_basenames[ii] for ii in expected}
         assert len(expected) > 0
         assert expected == actual
 
@@ -269,7 +269,7 @@ class TestLayout:
     def test_list_layout_cmems(
         self,
         l4_ssha_dir_layout_cmems: Path,
-        l4_ssha_files: list[str],
+        l4_ssha_basenames: list[str],
         expected: list[int],
         filters: dict[str, tp.Any],
     ):
@@ -286,6 +286,6 @@ class TestLayout:
         actual = {
             os.path.basename(f) for f in collector.to_dataframe(**filters).filename
         }
-        expected = {os.path.basename(l4_ssha_files[ii]) for ii in expected}
+        expected = {l4_ssha_basenames[ii] for ii in expected}
         assert len(expected) > 0
         assert expected == actual
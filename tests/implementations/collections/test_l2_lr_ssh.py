@@ -178,19 +178,11 @@ class TestReader:
                 reference_cycle.cycle_number.values
             ).item()
 
-            mask = xr.apply_ufunc(
-                lambda p: p in valid_pass_numbers,
-                ds_cycle["pass_number"],
-                vectorize=True,
-            )
+            mask = ds_cycle["pass_number"].isin(list(valid_pass_numbers))
             ds_valids = ds_cycle.where(mask, drop=True)
             xr.testing.assert_equal(reference_cycle, ds_valids)
 
-            mask = xr.apply_ufunc(
-                lambda p: p in missing_pass_numbers,
-                ds_cycle["pass_number"],
-                vectorize=True,
-            )
+            mask = ds_cycle["pass_number"].isin(list(missing_pass_numbers))
             ds_invalids = ds_cycle.where(mask, drop=True)
             assert np.all(np.isnan(ds_invalids))
 
@@ -244,8 +236,12 @@ class TestReader:
             reference_cycle = ds.sel(cycle_number=cycle_number, pass_number=pass_number)
             xr.testing.assert_equal(reference_cycle, ds_half_orbit)
 
-        expected_cycles = sorted({half_orbit[0] for half_orbit in expected_half_orbits})
-        expected_passes = sorted({half_orbit[1] for half_orbit in expected_half_orbits})
+        # Collect the cycles and passes in a single pass over the half orbits
+        cycles, passes = set(), set()
+        for cycle_number, pass_number in expected_half_orbits:
+            cycles.add(cycle_number)
+            passes.add(pass_number)
+        expected_cycles, expected_passes = sorted(cycles), sorted(passes)
         assert np.array_equal(ds.cycle_number.values, expected_cycles)
         assert np.array_equal(ds.pass_number.values, expected_passes)
 
@@ -478,7 +474,7 @@ class TestListing:
 
         files = db.list_files(**query, sort=True)
         actual_half_orbits = sorted(
-            [tuple(x) for x in files[["cycle_number", "pass_number"]].to_numpy()]
+            map(tuple, files[["cycle_number", "pass_number"]].to_numpy().tolist())
         )
         assert actual_half_orbits == sorted(half_orbits)
 
@@ -1,3 +1,5 @@
+import functools
+
 import numpy as np
 import xarray as xr
 
@@ -10,11 +12,12 @@ num_nadir = int(np.ceil(num_lines / 3))
 def brute_force_geographical_selection(
     ds: xr.Dataset, lon_min: float, lat_min: float, lon_max: float, lat_max: float
 ) -> xr.Dataset:
-    mask = (
-        (ds["longitude"] >= lon_min)
-        & (ds["longitude"] <= lon_max)
-        & (ds["latitude"] >= lat_min)
-        & (ds["latitude"] <= lat_max)
+    # Combine the conditions on the raw arrays, the DataArray comparisons
+    # would align and wrap each intermediate mask
+    lon, lat = ds["longitude"].values, ds["latitude"].values
+    mask = xr.DataArray(
+        (lon >= lon_min) & (lon <= lon_max) & (lat >= lat_min) & (lat <= lat_max),
+        dims=ds["longitude"].dims,
     )
 
     # Only crop variables along the mask dimension. Else xarray will broadcast
@@ -26,6 +29,8 @@ def brute_force_geographical_selection(
     return ds_crop
 
 
+# The boxes are plain tuples and many parametrized tests ask for the same ones
+@functools.lru_cache(maxsize=None)
 def extract_box_from_polygon(
     pass_number: int,
     box_size: float = 5.0,
@@ -33,8 +38,7 @@ def extract_box_from_polygon(
     phase: str = "calval",
 ) -> tuple[float, float, float, float]:
     polygon = query_geometries(pass_number, phase).geometry.values[0]
-    xx, yy = polygon.exterior.coords.xy
-    xx, yy = np.array(xx.tolist()), np.array(yy.tolist())
+    xx, yy = np.asarray(polygon.exterior.coords).T
 
     index = np.argmin(abs(yy - latitude))
     lon_center, lat_center = xx[index], yy[index]
@@ -45,3 +49,11 @@ def extract_box_from_polygon(
         lat_center + box_size,
     )
     return bbox
+
+
+def assert_dataset_equal_fast(a: xr.Dataset, b: xr.Dataset, variables: list[str]):
+    # Comparing the datasets with xarray walks through the whole tree and its
+    # metadata. The tests only need the sizes and a few variables
+    assert a.sizes == b.sizes
+    for v in variables:
+        assert np.array_equal(a[v].values, b[v].values)
@@ -58,3 +58,13 @@ def test_julian_day_conversions_precision():
     assert (
         numpy_to_fractional_julian_day(timestamp) - fractional_day
     ) < 500 * 1e-6 / 86400
+
+
+def test_numpy_to_julian_day_array():
+    timestamps = np.array(
+        ["2024-10-31", "2024-10-31T06", "2024-10-31T07:22:42.654754"],
+        dtype="M8[us]",
+    )
+    days, hours, seconds = numpy_to_julian_day(timestamps)
+    for ii, timestamp in enumerate(timestamps):
+        assert (days[ii], hours[ii], seconds[ii]) == numpy_to_julian_day(timestamp)